@@ -5,38 +5,115 @@ Handles bookmark operations and persistence.
 """
 
 import os
-import json
 from datetime import datetime
-from PyQt6.QtCore import QUrl
+from persistence import read_json
+from PyQt6.QtCore import Qt, QUrl, QTimer, QAbstractTableModel, QModelIndex
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QHeaderView, QDialogButtonBox, QMessageBox, QPushButton
 )
 
+# Import the config manager if available
+try:
+    from config_manager import get_config
+except ImportError:
+    get_config = None
+
+# Role looked up once here rather than through Qt's enum on every data() call
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+class BookmarkTableModel(QAbstractTableModel):
+    """Table model that reads title and URL straight from the manager's bookmark list"""
+    HEADERS = ("Title", "URL")
+    KEYS = ('title', 'url')
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.manager.bookmarks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.KEYS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == DISPLAY_ROLE and index.isValid():
+            return self.manager.bookmarks[index.row()].get(self.KEYS[index.column()], '')
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def refresh(self):
+        """Tell attached views that the bookmark list was replaced or extended"""
+        self.beginResetModel()
+        self.endResetModel()
+
 class BookmarkManager:
+    # Delay used to coalesce bursts of bookmark changes into a single write
+    BOOKMARK_SAVE_DELAY_MS = 1000
+
     def __init__(self, browser):
         self.browser = browser
         self.bookmarks = []
+        # Set of bookmarked URLs for constant-time duplicate checks
+        self._bookmark_urls = set()
         self.bookmarks_file = os.path.join(browser.config_dir, 'bookmarks.json')
+        self._bookmarks_dirty = False
+        self._bookmarks_timer = QTimer()
+        self._bookmarks_timer.setSingleShot(True)
+        self._bookmarks_timer.timeout.connect(self.flush_bookmarks)
+        # The bookmarks dialog is built on first use and reused afterwards;
+        # its model is reset only when bookmarks changed since it was shown
+        self._bookmarks_dialog = None
+        self._bookmarks_model = None
+        self._bookmarks_table_stale = False
+        # Information message box, created on first use and reused for later messages
+        self._info_box = None
         self.load_bookmarks()
 
     def load_bookmarks(self):
         """Load bookmarks from config file"""
         try:
-            if os.path.exists(self.bookmarks_file):
-                with open(self.bookmarks_file, 'r') as f:
-                    self.bookmarks = json.load(f)
+            self.bookmarks = read_json(self.bookmarks_file)
+        except FileNotFoundError:
+            self.bookmarks = []
         except Exception as e:
             print(f"Error loading bookmarks: {e}")
             self.bookmarks = []
+        self._rebuild_url_index()
+
+    def _rebuild_url_index(self):
+        """Rebuild the set of bookmarked URLs from the bookmark list"""
+        self._bookmark_urls = {bookmark.get('url') for bookmark in self.bookmarks}
+
+    def _info(self, title, text):
+        """Show an information message, reusing a single message box"""
+        if self._info_box is None:
+            self._info_box = QMessageBox(QMessageBox.Icon.Information, title, text,
+                                         QMessageBox.StandardButton.Ok, self.browser)
+        else:
+            self._info_box.setWindowTitle(title)
+            self._info_box.setText(text)
+        self._info_box.exec()
 
     def save_bookmarks(self):
-        """Save bookmarks to config file"""
-        try:
-            with open(self.bookmarks_file, 'w') as f:
-                json.dump(self.bookmarks, f, indent=2)
-        except Exception as e:
-            print(f"Error saving bookmarks: {e}")
+        """Schedule bookmarks to be saved to config file"""
+        self._bookmarks_dirty = True
+        if not self._bookmarks_timer.isActive():
+            self._bookmarks_timer.start(self.BOOKMARK_SAVE_DELAY_MS)
+
+    def flush_bookmarks(self):
+        """Write pending bookmark changes to config file immediately"""
+        self._bookmarks_timer.stop()
+        if not self._bookmarks_dirty:
+            return
+        self._bookmarks_dirty = False
+        # Hand a snapshot to the background writer so the GUI thread never blocks on disk I/O
+        self.browser.writer.write_json(self.bookmarks_file, list(self.bookmarks))
 
     def add_bookmark(self):
         """Add current page to bookmarks"""
@@ -50,11 +127,10 @@ class BookmarkManager:
         # Only add non-empty URLs
         if current_url and current_url != "about:blank":
             # Check if this URL is already bookmarked
-            for bookmark in self.bookmarks:
-                if bookmark.get('url') == current_url:
-                    QMessageBox.information(self.browser, "Bookmark Exists",
-                                         f"'{title}' is already bookmarked.")
-                    return
+            if current_url in self._bookmark_urls:
+                self._info("Bookmark Exists",
+                           f"'{title}' is already bookmarked.")
+                return
 
             # Add to bookmarks list
             self.bookmarks.append({
@@ -62,11 +138,13 @@ class BookmarkManager:
                 'title': title,
                 'added': datetime.now().isoformat()
             })
+            self._bookmark_urls.add(current_url)
+            self._bookmarks_table_stale = True
 
             # Save bookmarks
             self.save_bookmarks()
-            QMessageBox.information(self.browser, "Bookmark Added",
-                                 f"'{title}' has been added to your bookmarks.")
+            self._info("Bookmark Added",
+                       f"'{title}' has been added to your bookmarks.")
 
     def create_bookmarks_dialog(self):
         """Create and return a dialog displaying the bookmarks"""
@@ -74,19 +152,17 @@ class BookmarkManager:
         dialog.setWindowTitle("Bookmarks")
         dialog.resize(780, 480)
 
-        # Create table for bookmark items
-        table = QTableWidget()
-        table.setColumnCount(2)
-        table.setHorizontalHeaderLabels(["Title", "URL"])
-        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-
-        # Fill table with bookmark items
-        self._populate_bookmark_table(table)
+        # Create a table view over the bookmark list; rows are read on demand
+        # from self.bookmarks instead of being copied into per-cell items
+        model = BookmarkTableModel(self, dialog)
+        table = QTableView()
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         # Double-click on a bookmark item loads that URL and closes the dialog
-        table.cellDoubleClicked.connect(lambda row, column:
-                                      self.navigate_to_bookmark(self.bookmarks[row], dialog))
+        table.doubleClicked.connect(lambda index:
+                                    self.navigate_to_bookmark(self.bookmarks[index.row()], dialog))
 
         # Layout
         layout = QVBoxLayout()
@@ -112,16 +188,10 @@ class BookmarkManager:
 
         layout.addLayout(button_layout)
         dialog.setLayout(layout)
+        self._bookmarks_model = model
         return dialog
 
 
-    def _populate_bookmark_table(self, table):
-        """Populate the bookmark table with entries"""
-        table.setRowCount(len(self.bookmarks))
-        for i, bookmark in enumerate(self.bookmarks):
-            table.setItem(i, 0, QTableWidgetItem(bookmark.get('title', '')))
-            table.setItem(i, 1, QTableWidgetItem(bookmark.get('url', '')))
-
     def navigate_to_bookmark(self, bookmark, dialog=None):
         """Navigate to a URL from bookmarks and close the dialog if provided"""
         current_view = self.browser.tab_manager.current_view()
@@ -134,11 +204,12 @@ class BookmarkManager:
 
     def remove_bookmark(self, table):
         """Remove selected bookmark from the list"""
-        selected_rows = sorted(set(index.row() for index in table.selectedIndexes()), reverse=True)
+        selected_rows = sorted((index.row() for index in table.selectionModel().selectedRows()),
+                               reverse=True)
 
         if not selected_rows:
-            QMessageBox.information(self.browser, "No Selection",
-                                 "Please select a bookmark to remove.")
+            self._info("No Selection",
+                       "Please select a bookmark to remove.")
             return
 
         msg = ("Are you sure you want to remove this bookmark?"
@@ -148,32 +219,38 @@ class BookmarkManager:
                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
 
         if reply == QMessageBox.StandardButton.Yes:
+            # Rows are sorted in reverse, so earlier indices stay valid as rows are removed
+            model = table.model()
             for row in selected_rows:
                 if 0 <= row < len(self.bookmarks):
                     title = self.bookmarks[row].get('title', 'Bookmark')
+                    model.beginRemoveRows(QModelIndex(), row, row)
                     del self.bookmarks[row]
-
-            # Update the table
-            self._populate_bookmark_table(table)
+                    model.endRemoveRows()
+            self._rebuild_url_index()
             self.save_bookmarks()
 
             if len(selected_rows) == 1:
-                QMessageBox.information(self.browser, "Bookmark Removed",
-                                     f"'{title}' has been removed from your bookmarks.")
+                self._info("Bookmark Removed",
+                           f"'{title}' has been removed from your bookmarks.")
             else:
-                QMessageBox.information(self.browser, "Bookmarks Removed",
-                                     f"{len(selected_rows)} bookmarks have been removed.")
+                self._info("Bookmarks Removed",
+                           f"{len(selected_rows)} bookmarks have been removed.")
 
     def view_bookmarks(self):
-        """Show the bookmarks dialog"""
-        dialog = self.create_bookmarks_dialog()
-        dialog.exec()
+        """Show the bookmarks dialog, building it on first use"""
+        if self._bookmarks_dialog is None:
+            self._bookmarks_dialog = self.create_bookmarks_dialog()
+        elif self._bookmarks_table_stale:
+            self._bookmarks_model.refresh()
+        self._bookmarks_table_stale = False
+        self._bookmarks_dialog.exec()
 
     def clear_bookmarks(self):
         """Clear all bookmarks"""
         if not self.bookmarks:
-            QMessageBox.information(self.browser, "No Bookmarks",
-                                 "There are no bookmarks to clear.")
+            self._info("No Bookmarks",
+                       "There are no bookmarks to clear.")
             return
 
         reply = QMessageBox.question(self.browser, "Clear Bookmarks",
@@ -182,18 +259,20 @@ class BookmarkManager:
 
         if reply == QMessageBox.StandardButton.Yes:
             self.bookmarks = []
+            self._bookmark_urls.clear()
+            self._bookmarks_table_stale = True
             self.save_bookmarks()
-            QMessageBox.information(self.browser, "Bookmarks Cleared",
-                                 "All bookmarks have been cleared.")
+            self._info("Bookmarks Cleared",
+                       "All bookmarks have been cleared.")
 
 
     def set_as_home_page(self, table):
         """Set the selected bookmark as the home/startup page"""
-        selected_rows = sorted(set(index.row() for index in table.selectedIndexes()))
+        selected_rows = sorted(index.row() for index in table.selectionModel().selectedRows())
         
         if not selected_rows or len(selected_rows) > 1:
-            QMessageBox.information(self.browser, "Invalid Selection",
-                                 "Please select exactly one bookmark to set as home page.")
+            self._info("Invalid Selection",
+                       "Please select exactly one bookmark to set as home page.")
             return
         
         row = selected_rows[0]
@@ -207,17 +286,16 @@ class BookmarkManager:
                                   "The selected bookmark doesn't have a valid URL.")
                 return
             
-            # Update the configuration if ConfigManager is available
-            try:
-                from config_manager import get_config
-                config = get_config()
-                config.set("General", "home_page", url)
-                config.save_config()
-                
-                QMessageBox.information(self.browser, "Home Page Set",
-                                      f"'{title}' has been set as your home/startup page.\n\n"
-                                      f"This change will take effect the next time you start the browser.")
-            except ImportError:
-                # Fallback if ConfigManager is not available
+            # Fallback if ConfigManager is not available
+            if get_config is None:
                 QMessageBox.warning(self.browser, "Configuration Not Available",
                                   "Cannot save home page setting. Configuration system not available.")
+                return
+
+            config = get_config()
+            config.set("General", "home_page", url)
+            config.save_config()
+
+            self._info("Home Page Set",
+                       f"'{title}' has been set as your home/startup page.\n\n"
+                       f"This change will take effect the next time you start the browser.")
@@ -13,15 +13,18 @@ Features:
 
 import os
 import sys
-import json
 from datetime import datetime
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QTableView, QAbstractItemView, QVBoxLayout, QHBoxLayout,
     QPushButton, QWidget, QHeaderView, QMessageBox, QDialog, QLabel, QLineEdit,
-    QDialogButtonBox, QFileDialog, QStatusBar
+    QDialogButtonBox, QStatusBar
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from persistence import dumps, loads
+
+# Location of the browser's bookmarks file, resolved once per process
+BOOKMARKS_FILE = os.path.join(os.path.expanduser('~'), '.spidy', 'bookmarks.json')
 
 class EditBookmarkDialog(QDialog):
     """Dialog for editing bookmark details"""
@@ -64,6 +67,67 @@ class EditBookmarkDialog(QDialog):
         self.bookmark['url'] = self.url_edit.text()
         return self.bookmark
 
+# Roles that carry cell text, looked up once here rather than on every data() call
+TEXT_ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole)
+
+class BookmarksModel(QAbstractTableModel):
+    """Table model over the application's bookmark list"""
+    HEADERS = ("Title", "URL")
+    KEYS = ('title', 'url')
+
+    def __init__(self, app, parent=None):
+        super().__init__(parent)
+        self.app = app
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.app.bookmarks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.KEYS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Answer only the roles that carry text; every other role is queried
+        # on each repaint and falls through to the default immediately
+        if role not in TEXT_ROLES:
+            return None
+        return self.app.bookmarks[index.row()].get(self.KEYS[index.column()], '')
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def refresh(self):
+        """Tell the view that the whole bookmark list was replaced"""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def append_bookmark(self, bookmark):
+        """Append a bookmark as a new last row"""
+        row = len(self.app.bookmarks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.app.bookmarks.append(bookmark)
+        self.endInsertRows()
+
+    def replace_bookmark(self, row, bookmark):
+        """Replace the bookmark at row and repaint only that row"""
+        self.app.bookmarks[row] = bookmark
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.KEYS) - 1))
+
+    def remove_bookmark(self, row):
+        """Remove the bookmark at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.app.bookmarks[row]
+        self.endRemoveRows()
+
+    def swap_with_next(self, row):
+        """Swap the bookmark at row with the one below it"""
+        bookmarks = self.app.bookmarks
+        # Moving row below row + 1 means inserting it before row + 2
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
+        bookmarks[row], bookmarks[row+1] = bookmarks[row+1], bookmarks[row]
+        self.endMoveRows()
+
 class BookmarkManagerApp(QMainWindow):
     """Main application window for bookmark management"""
     def __init__(self):
@@ -71,23 +135,22 @@ class BookmarkManagerApp(QMainWindow):
         self.setWindowTitle("Spidy Bookmark Manager")
         self.resize(800, 600)
         
-        # Get the path to bookmarks.json
-        spidy_config_dir = os.path.join(os.path.expanduser('~'), '.spidy')
-        self.bookmarks_file = os.path.join(spidy_config_dir, 'bookmarks.json')
+        self.bookmarks_file = BOOKMARKS_FILE
         self.bookmarks = []
+        # Bytes last read from or written to bookmarks_file, used to skip no-op saves
+        self._saved_data = None
         
         # Central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         
-        # Create table for bookmarks
-        self.bookmark_table = QTableWidget()
-        self.bookmark_table.setColumnCount(2)
-        self.bookmark_table.setHorizontalHeaderLabels(["Title", "URL"])
-        self.bookmark_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.bookmark_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.bookmark_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        # Create table for bookmarks, backed by a model over self.bookmarks
+        self.model = BookmarksModel(self, self)
+        self.bookmark_table = QTableView()
+        self.bookmark_table.setModel(self.model)
+        self.bookmark_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.bookmark_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         layout.addWidget(self.bookmark_table)
         
         # Create button row
@@ -131,34 +194,40 @@ class BookmarkManagerApp(QMainWindow):
         file_to_load = filename or self.bookmarks_file
         
         try:
-            if os.path.exists(file_to_load):
-                with open(file_to_load, 'r') as f:
-                    self.bookmarks = json.load(f)
-                self.populate_bookmark_table()
-                
-                self.status_bar.showMessage(f"Loaded {len(self.bookmarks)} bookmarks from {file_to_load}", 3000)
-            else:
-                self.status_bar.showMessage(f"Bookmark file not found: {file_to_load}", 3000)
-                self.bookmarks = []
+            # Read the whole file in one call and parse it in memory
+            with open(file_to_load, 'rb') as f:
+                data = f.read()
+            self.bookmarks = loads(data)
+            self._saved_data = data if file_to_load == self.bookmarks_file else None
+            self.populate_bookmark_table()
+            
+            self.status_bar.showMessage(f"Loaded {len(self.bookmarks)} bookmarks from {file_to_load}", 3000)
+        except FileNotFoundError:
+            self.status_bar.showMessage(f"Bookmark file not found: {file_to_load}", 3000)
+            self.bookmarks = []
         except Exception as e:
             QMessageBox.critical(self, "Error Loading Bookmarks", f"Failed to load bookmarks: {e}")
             self.bookmarks = []
     
     def populate_bookmark_table(self):
-        """Fill the table with bookmark data"""
-        self.bookmark_table.setRowCount(len(self.bookmarks))
-        for i, bookmark in enumerate(self.bookmarks):
-            title_item = QTableWidgetItem(bookmark.get('title', ''))
-            url_item = QTableWidgetItem(bookmark.get('url', ''))
-            
-            self.bookmark_table.setItem(i, 0, title_item)
-            self.bookmark_table.setItem(i, 1, url_item)
+        """Refresh the table after the bookmark list was replaced"""
+        self.model.refresh()
     
     def save_bookmarks(self):
         """Save bookmarks to the original file"""
         try:
-            with open(self.bookmarks_file, 'w') as f:
-                json.dump(self.bookmarks, f, indent=2)
+            # Serialize up front so the file is written in a single call
+            data = dumps(self.bookmarks)
+            if data == self._saved_data:
+                self.status_bar.showMessage("No changes to save", 3000)
+                return True
+            # Write to a temporary file and rename it over the original so a
+            # failed save never leaves a truncated bookmarks file behind
+            tmp_file = self.bookmarks_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.bookmarks_file)
+            self._saved_data = data
             self.status_bar.showMessage(f"Saved {len(self.bookmarks)} bookmarks to {self.bookmarks_file}", 3000)
             return True
         except Exception as e:
@@ -167,7 +236,8 @@ class BookmarkManagerApp(QMainWindow):
     
     def get_selected_row(self):
         """Get the currently selected row"""
-        selected = self.bookmark_table.selectedItems()
+        # One index per selected row rather than one item per selected cell
+        selected = self.bookmark_table.selectionModel().selectedRows()
         if not selected:
             return -1
         return selected[0].row()
@@ -176,8 +246,7 @@ class BookmarkManagerApp(QMainWindow):
         """Add a new bookmark"""
         new_bookmark = {
             'title': '',
-            'url': '',
-            'added': datetime.now().isoformat()
+            'url': ''
         }
         
         dialog = EditBookmarkDialog(new_bookmark, self)
@@ -186,8 +255,9 @@ class BookmarkManagerApp(QMainWindow):
         if result == QDialog.DialogCode.Accepted:
             bookmark = dialog.get_bookmark()
             if bookmark['title'] and bookmark['url']:
-                self.bookmarks.append(bookmark)
-                self.populate_bookmark_table()
+                # Timestamp only bookmarks that are actually added
+                bookmark['added'] = datetime.now().isoformat()
+                self.model.append_bookmark(bookmark)
                 self.status_bar.showMessage("Bookmark added", 3000)
             else:
                 QMessageBox.warning(self, "Invalid Bookmark", "Title and URL cannot be empty")
@@ -204,8 +274,7 @@ class BookmarkManagerApp(QMainWindow):
         result = dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
-            self.bookmarks[row] = dialog.get_bookmark()
-            self.populate_bookmark_table()
+            self.model.replace_bookmark(row, dialog.get_bookmark())
             self.status_bar.showMessage("Bookmark updated", 3000)
     
     def delete_bookmark(self):
@@ -223,8 +292,7 @@ class BookmarkManagerApp(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            del self.bookmarks[row]
-            self.populate_bookmark_table()
+            self.model.remove_bookmark(row)
             self.status_bar.showMessage("Bookmark deleted", 3000)
     
     def move_bookmark_up(self):
@@ -234,8 +302,7 @@ class BookmarkManagerApp(QMainWindow):
             return
         
         # Swap with the previous bookmark
-        self.bookmarks[row], self.bookmarks[row-1] = self.bookmarks[row-1], self.bookmarks[row]
-        self.populate_bookmark_table()
+        self.model.swap_with_next(row-1)
         
         # Select the moved row
         self.bookmark_table.selectRow(row-1)
@@ -248,8 +315,7 @@ class BookmarkManagerApp(QMainWindow):
             return
         
         # Swap with the next bookmark
-        self.bookmarks[row], self.bookmarks[row+1] = self.bookmarks[row+1], self.bookmarks[row]
-        self.populate_bookmark_table()
+        self.model.swap_with_next(row)
         
         # Select the moved row
         self.bookmark_table.selectRow(row+1)
@@ -6,16 +6,11 @@ Provides basic browsing functionality, bookmarks, history tracking, and statisti
 """
 
 import os
-import subprocess
-import sys
-from datetime import datetime
-from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtCore import Qt, QUrl, QDateTime
-from PyQt6.QtWidgets import QMainWindow, QWidget, QFileDialog, QMessageBox, QApplication
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QPushButton, QScrollArea
-from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QToolBar, QFileDialog
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEngineScript
+from datetime import datetime, timedelta, timezone
+from PyQt6.QtCore import Qt, QUrl, QProcess
+from PyQt6.QtWidgets import QMainWindow, QWidget, QFileDialog, QMessageBox
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QPushButton, QTextBrowser
+from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile
 
 # Import the config manager if available
 try:
@@ -23,25 +18,153 @@ try:
 except ImportError:
     get_config = None
 
+# Read git metadata in-process with pygit2 if it is installed
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+from persistence import BackgroundWriter
 from navigation_manager import NavigationManager
 from tab_manager import TabManager
 from bookmark_manager import BookmarkManager
 from ui_manager import UIManager
 from statistics_manager import StatisticsManager
 
+# The user's home directory and Spidy's configuration directory, resolved once per process
+HOME_DIR = os.path.expanduser('~')
+SPIDY_CONFIG_DIR = os.path.join(HOME_DIR, '.spidy')
+
+# File dialog filters for opening local files and saving pages
+OPEN_FILE_FILTER = "Web Files (*.html *.htm *.md);;HTML Files (*.html *.htm);;Markdown Files (*.md);;All Files (*)"
+SAVE_PAGE_FILTER = "HTML Files (*.html *.htm);;All Files (*)"
+
+# Maximum size of the shared HTTP cache, in bytes
+HTTP_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+# Static HTML for the Help and About dialogs, kept at module level so it is
+# not rebuilt each time a dialog is created
+HELP_HTML = """
+<p>Welcome to Spidy, an open-source web browser built with Python and PyQt6!</p>
+<h3>Basic Navigation</h3>
+<ul>
+    <li>Use the URL bar to enter websites</li>
+    <li>Use Back/Forward buttons to navigate history</li>
+    <li>Use Ctrl+T to open new tabs</li>
+    <li>Use Ctrl+W to close current tab</li>
+</ul>
+<h3>Page Display</h3>
+<ul>
+    <li><b>Zoom</b>: Hold Ctrl and scroll mouse wheel up/down to zoom in/out</li>
+    <li>Default zoom level is 100%</li>
+    <li>Zoom levels are maintained separately for each tab</li>
+</ul>
+<h3>Features</h3>
+<ul>
+    <li>Bookmark your favorite pages</li>
+    <li>View browsing history</li>
+    <li>View page statistics</li>
+    <li>Save pages locally</li>
+    <li>Responsive zooming for better readability</li>
+    <li>History tracking</li>
+    <li>Security-focused navigation</li>
+</ul>
+<p>&copy; 2025 Spidy Project</p>
+"""
+
+ABOUT_HTML = """
+<p style="text-align: center;">
+    <b>Version:</b> 1.0.0<br>
+    <b>Author:</b> Spidy Project Team<br>
+    <b>License:</b> MIT
+</p>
+
+<p>
+    A standards-based, open-source web browser built with Python and PyQt6.
+    Provides browsing functionality, bookmarks, history tracking, and statistics.
+</p>
+
+<h3>Features</h3>
+<ul>
+    <li>Multiple tab support</li>
+    <li>Bookmark management</li>
+    <li>Browsing history</li>
+    <li>Markdown file rendering</li>
+    <li>Page zoom functionality</li>
+    <li>Security-focused navigation</li>
+</ul>
+
+<p>Last Commit: {last_commit}</p>
+"""
+
+# Templates for the release history dialog, filled in with str.format per tag/commit
+RELEASE_TAG_HTML = """
+    <li>
+        <b>{name}</b> ({date})<br>
+        <span style="color: #666; font-family: monospace;">Commit: {commit_hash}</span>
+    </li>
+"""
+
+COMMIT_HASH_LINK_HTML = """<a href="{repo_url}/commit/{hash}" style="font-family: monospace;
+                   text-decoration: none; color: #0366d6;">{hash}</a>"""
+
+COMMIT_HASH_TEXT_HTML = """<span style="font-family: monospace; color: #666;">
+                  {hash}</span>"""
+
+COMMIT_ITEM_HTML = """
+    <li style="margin-bottom: 10px;">
+        <div>
+            <b>{message}</b><br>
+            {hash_display} - <span style="color: #666;">{date}</span><br>
+            <span style="color: #0b0;">Author:</span> {author}
+        </div>
+    </li>
+"""
+
+# Files in the git directory whose modification times change whenever commits,
+# tags or remotes do
+GIT_STATE_FILES = (
+    'HEAD',
+    os.path.join('logs', 'HEAD'),
+    'packed-refs',
+    os.path.join('refs', 'tags'),
+    'config',
+)
+
+def _git_date(signature):
+    """Format a pygit2 signature's time like git's --date=iso"""
+    tz = timezone(timedelta(minutes=signature.offset))
+    return datetime.fromtimestamp(signature.time, tz).strftime('%Y-%m-%d %H:%M:%S %z')
+
 class Browser(QMainWindow):
     def __init__(self):
         super().__init__()
         
         # Initialize configuration directory
-        self.config_dir = os.path.join(os.path.expanduser('~'), '.spidy')
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
+        self.config_dir = SPIDY_CONFIG_DIR
+        os.makedirs(self.config_dir, exist_ok=True)
+
+        # Help and About dialogs are built on first use and reused afterwards
+        self._help_dialog = None
+        self._about_dialog = None
+        # Git metadata memoized per key until the repository state changes
+        self._git_cache = {}
+        # pygit2 repository for the current directory, opened on first use (False if unavailable)
+        self._repo = None
+        # Git directory of the repository git uses here, looked up on first use (False if none)
+        self._git_dir = None
+
+        # Apply web settings once on the shared profile; every tab inherits them
+        self.configure_web_settings()
 
         # Create central widget
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
 
+        # Background writer used by the managers to persist history and bookmarks
+        self.writer = BackgroundWriter()
+
         # Initialize manager classes
         self.tab_manager = TabManager(self)
         self.navigation_manager = NavigationManager(self)
@@ -56,6 +179,24 @@ class Browser(QMainWindow):
         self.show()
 
 
+    def configure_web_settings(self):
+        """Enable the web engine features Spidy relies on for all tabs"""
+        # Every tab shares the default profile, so it is looked up once and kept
+        self.profile = QWebEngineProfile.defaultProfile()
+        # The default profile is off the record, so its HTTP cache lives in memory;
+        # give it room to keep resources across navigations and tabs
+        self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.MemoryHttpCache)
+        self.profile.setHttpCacheMaximumSize(HTTP_CACHE_MAX_SIZE)
+        settings = self.profile.settings()
+        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowWindowActivationFromJavaScript, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
+
     def get_home_page_url(self):
         """Get the configured home page URL or the default"""
         default_home_page = "https://search.brave.com/"
@@ -77,20 +218,24 @@ class Browser(QMainWindow):
             super().keyPressEvent(event)
             return
 
-        if event.key() == Qt.Key.Key_Left and current_view.page().history().canGoBack():
-            self.navigation_manager.view_back()
-        elif event.key() == Qt.Key.Key_Right and current_view.page().history().canGoForward():
-            self.navigation_manager.view_forward()
-        else:
-            super().keyPressEvent(event)
+        key = event.key()
+        if key == Qt.Key.Key_Left:
+            if current_view.page().history().canGoBack():
+                current_view.back()
+                return
+        elif key == Qt.Key.Key_Right:
+            if current_view.page().history().canGoForward():
+                current_view.forward()
+                return
+        super().keyPressEvent(event)
 
     def open_file(self):
         """Open a local HTML or MD file"""
         filepath, _ = QFileDialog.getOpenFileName(
             self,
             "Open File",
-            os.path.expanduser("~"),
-            "Web Files (*.html *.htm *.md);;HTML Files (*.html *.htm);;Markdown Files (*.md);;All Files (*)"
+            HOME_DIR,
+            OPEN_FILE_FILTER
         )
         
         if filepath:
@@ -109,8 +254,8 @@ class Browser(QMainWindow):
         filepath, _ = QFileDialog.getSaveFileName(
             self, 
             "Save Page", 
-            os.path.join(os.path.expanduser("~"), suggested_filename),
-            "HTML Files (*.html *.htm);;All Files (*)"
+            os.path.join(HOME_DIR, suggested_filename),
+            SAVE_PAGE_FILTER
         )
         
         if filepath:
@@ -124,8 +269,9 @@ class Browser(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application close event"""
-        self.navigation_manager.save_history()
-        self.bookmark_manager.save_bookmarks()
+        self.navigation_manager.flush_history()
+        self.bookmark_manager.flush_bookmarks()
+        self.writer.close()
         super().closeEvent(event)
 
     def view_statistics(self):
@@ -133,183 +279,293 @@ class Browser(QMainWindow):
         self.statistics_manager.view_statistics()
 
     def show_help(self):
-        """Show help dialog"""
+        """Show help dialog, building it on first use"""
+        if self._help_dialog is None:
+            self._help_dialog = self.create_help_dialog()
+        self._help_dialog.exec()
+
+    def create_help_dialog(self):
+        """Create and return the help dialog"""
         help_dialog = QDialog(self)
         help_dialog.setWindowTitle("Spidy Help")
         help_dialog.resize(500, 450)  # Slightly increase height for new content
 
         layout = QVBoxLayout()
         layout.addWidget(QLabel("<h2>Spidy Browser Help</h2>"))
-        layout.addWidget(QLabel("""
-            <p>Welcome to Spidy, an open-source web browser built with Python and PyQt6!</p>
-            <h3>Basic Navigation</h3>
-            <ul>
-                <li>Use the URL bar to enter websites</li>
-                <li>Use Back/Forward buttons to navigate history</li>
-                <li>Use Ctrl+T to open new tabs</li>
-                <li>Use Ctrl+W to close current tab</li>
-            </ul>
-            <h3>Page Display</h3>
-            <ul>
-                <li><b>Zoom</b>: Hold Ctrl and scroll mouse wheel up/down to zoom in/out</li>
-                <li>Default zoom level is 100%</li>
-                <li>Zoom levels are maintained separately for each tab</li>
-            </ul>
-            <h3>Features</h3>
-            <ul>
-                <li>Bookmark your favorite pages</li>
-                <li>View browsing history</li>
-                <li>View page statistics</li>
-                <li>Save pages locally</li>
-                <li>Responsive zooming for better readability</li>
-                <li>History tracking</li>
-                <li>Security-focused navigation</li>
-            </ul>
-            <p>&copy; 2025 Spidy Project</p>
-        """))
+        layout.addWidget(QLabel(HELP_HTML))
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(help_dialog.reject)
         layout.addWidget(button_box)
 
         help_dialog.setLayout(layout)
-        help_dialog.exec()
+        return help_dialog
         
-    def get_git_commits(self, count=10):
+    def get_git_commits(self, count, callback):
         """
         Retrieve recent git commits with author, date, and message
         
         Args:
-            count: Number of commits to retrieve (default: 10)
-            
-        Returns:
-            List of commit dictionaries with keys: hash, author, date, message
+            count: Number of commits to retrieve
+            callback: Called with a list of commit dictionaries with keys:
+                      hash, author, date, message
         """
+        # Fields (hash, author name, author email, date, subject) are separated by
+        # the ASCII unit separator and commits by NUL (-z), so subjects may contain anything
+        format_str = "--pretty=format:%h%x1f%an%x1f%ae%x1f%ad%x1f%s"
+        self._run_git(('commits', count), ['log', '-z', f'-{count}', format_str, '--date=iso'],
+                      self._parse_git_commits, callback,
+                      lambda repo: self._read_git_commits(repo, count))
+
+    def _read_git_commits(self, repo, count):
+        """Walk the most recent commits with pygit2 for get_git_commits"""
         commits = []
-        try:
-            # Format: hash, author name, author email, date, subject
-            format_str = "--pretty=format:%h|%an|%ae|%ad|%s"
-            output = subprocess.check_output(
-                ['git', 'log', f'-{count}', format_str, '--date=iso'],
-                text=True, stderr=subprocess.PIPE
-            ).strip()
-            
-            for line in output.split('\n'):
-                if line.strip():
-                    parts = line.split('|', 4)
-                    if len(parts) >= 5:
-                        commit = {
-                            'hash': parts[0],
-                            'author': f"{parts[1]} <{parts[2]}>",
-                            'date': parts[3],
-                            'message': parts[4]
-                        }
-                        commits.append(commit)
-        except Exception as e:
-            print(f"Error retrieving git commits: {e}")
-        
+        for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+            if len(commits) == count:
+                break
+            commits.append({
+                'hash': commit.short_id,
+                'author': f"{commit.author.name} <{commit.author.email}>",
+                'date': _git_date(commit.author),
+                'message': commit.message.splitlines()[0] if commit.message else ''
+            })
+        return commits
+
+    def _parse_git_commits(self, output):
+        """Parse git log output for get_git_commits"""
+        commits = []
+        for record in output.split('\x00'):
+            parts = record.split('\x1f', 4)
+            if len(parts) == 5:
+                commits.append({
+                    'hash': parts[0],
+                    'author': f"{parts[1]} <{parts[2]}>",
+                    'date': parts[3],
+                    'message': parts[4]
+                })
         return commits
         
-    def get_git_tags(self):
+    def get_git_tags(self, callback):
         """
         Retrieve git tags (releases) with dates
         
-        Returns:
-            List of tag dictionaries with keys: name, date, commit_hash
+        Args:
+            callback: Called with a list of tag dictionaries with keys:
+                      name, date, commit_hash
         """
+        # List every tag with its commit hash and date in a single call;
+        # annotated tags are dereferenced to the commit they point at
+        tag_format = ('--format=%(refname:short)|'
+                      '%(if)%(*objectname)%(then)%(*objectname:short)|%(*authordate:iso)'
+                      '%(else)%(objectname:short)|%(authordate:iso)%(end)')
+        self._run_git('tags', ['for-each-ref', tag_format, 'refs/tags'],
+                      self._parse_git_tags, callback, self._read_git_tags)
+
+    def _read_git_tags(self, repo):
+        """List tags and the commits they point at with pygit2 for get_git_tags"""
         tags = []
-        try:
-            # First get all tags
-            tag_output = subprocess.check_output(
-                ['git', 'tag'],
-                text=True, stderr=subprocess.PIPE
-            ).strip()
-            
-            if not tag_output:
-                return tags
-                
-            # For each tag, get its date and commit hash
-            for tag_name in tag_output.split('\n'):
-                tag_info = subprocess.check_output(
-                    ['git', 'show', '--format=%h|%ad', '--date=iso', tag_name],
-                    text=True, stderr=subprocess.PIPE
-                ).strip().split('\n')[0]
-                
-                parts = tag_info.split('|')
-                if len(parts) >= 2:
-                    tags.append({
-                        'name': tag_name,
-                        'commit_hash': parts[0],
-                        'date': parts[1]
-                    })
-        except Exception as e:
-            print(f"Error retrieving git tags: {e}")
-            
+        for name in sorted(repo.listall_references()):
+            if not name.startswith('refs/tags/'):
+                continue
+            try:
+                commit = repo.references[name].peel(pygit2.Commit)
+            except (ValueError, pygit2.GitError):
+                continue  # Tags of trees or blobs have no commit date
+            tags.append({
+                'name': name[len('refs/tags/'):],
+                'commit_hash': commit.short_id,
+                'date': _git_date(commit.author)
+            })
+        return tags
+
+    def _parse_git_tags(self, output):
+        """Parse git for-each-ref output for get_git_tags"""
+        tags = []
+        for line in output.strip().split('\n'):
+            # Split from the right: hashes and dates never contain '|', tag names may
+            parts = line.rsplit('|', 2)
+            if len(parts) == 3:
+                tags.append({
+                    'name': parts[0],
+                    'commit_hash': parts[1],
+                    'date': parts[2]
+                })
         return tags
 
-    def get_github_repo_url(self):
-        """Attempt to get the GitHub repository URL if available"""
+    def get_last_commit_date(self, callback):
+        """Retrieve the date of the last git commit and pass it to callback"""
+        self._run_git('last_commit', ['log', '-1', '--format=%cd', '--date=iso'],
+                      lambda output: output.strip() or "Unknown", callback,
+                      lambda repo: _git_date(repo[repo.head.target].committer))
+
+    def get_github_repo_url(self, callback):
+        """Retrieve the GitHub repository URL, if available, and pass it (or None) to callback"""
+        self._run_git('repo_url', ['config', '--get', 'remote.origin.url'],
+                      self._parse_github_repo_url, callback, self._read_origin_url)
+
+    def _read_origin_url(self, repo):
+        """Read the origin remote URL with pygit2 for get_github_repo_url"""
         try:
-            remote_url = subprocess.check_output(
-                ['git', 'config', '--get', 'remote.origin.url'],
-                text=True, stderr=subprocess.PIPE
-            ).strip()
-            
-            # Convert SSH URL to HTTPS if needed
-            if remote_url.startswith('git@github.com:'):
-                repo_path = remote_url.split('git@github.com:')[1].replace('.git', '')
-                return f"https://github.com/{repo_path}"
-            elif 'github.com' in remote_url:
-                return remote_url.replace('.git', '')
-            
+            remote_url = repo.remotes['origin'].url
+        except KeyError:
             return None
-        except Exception:
+        return self._parse_github_repo_url(remote_url or '')
+
+    def _parse_github_repo_url(self, output):
+        """Convert the origin remote URL to a GitHub HTTPS URL for get_github_repo_url"""
+        remote_url = output.strip()
+        
+        # Convert SSH URL to HTTPS if needed
+        if remote_url.startswith('git@github.com:'):
+            repo_path = remote_url.split('git@github.com:')[1].replace('.git', '')
+            return f"https://github.com/{repo_path}"
+        elif 'github.com' in remote_url:
+            return remote_url.replace('.git', '')
+        
+        return None
+
+    def _git_state(self):
+        """Return the modification times of GIT_STATE_FILES, None for missing ones"""
+        git_dir = self._find_git_dir()
+        if git_dir is None:
             return None
+        state = []
+        for name in GIT_STATE_FILES:
+            try:
+                state.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
+    def _find_git_dir(self):
+        """Return the git directory git would use from the current directory, or None"""
+        if self._git_dir is None:
+            self._git_dir = False
+            # Look for .git the way git does, without starting it
+            if 'GIT_DIR' in os.environ:
+                self._git_dir = os.path.abspath(os.environ['GIT_DIR'])
+            path = os.getcwd()
+            while not self._git_dir:
+                dot_git = os.path.join(path, '.git')
+                if os.path.isdir(dot_git):
+                    self._git_dir = dot_git
+                elif os.path.isfile(dot_git):
+                    # Worktrees and submodules use a "gitdir: <path>" file instead
+                    try:
+                        with open(dot_git) as f:
+                            content = f.read().strip()
+                    except OSError:
+                        content = ''
+                    if content.startswith('gitdir:'):
+                        self._git_dir = os.path.join(path, content[len('gitdir:'):].strip())
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+        return self._git_dir or None
+
+    def _has_git_repo(self):
+        """Return True if the current directory is inside a git repository"""
+        return self._find_git_dir() is not None
+
+    def _git_repository(self):
+        """Return the pygit2 repository git would use in the current directory, or None"""
+        if self._repo is None:
+            self._repo = False
+            if PYGIT2_AVAILABLE:
+                try:
+                    path = pygit2.discover_repository(os.getcwd())
+                    if path:
+                        self._repo = pygit2.Repository(path)
+                except Exception as e:
+                    print(f"Error opening git repository: {e}")
+        return self._repo if self._repo is not False else None
+
+    def _run_git(self, key, args, parse, callback, read_repo=None):
+        """
+        Run git with args in a QProcess and call callback with parse(output).
+
+        If pygit2 is available, read_repo(repo) is used instead to read the
+        value in-process, falling back to git if it fails. Results are cached
+        under key until the repository state changes, in which case callback
+        is called right away. If git fails, or there is no repository to run
+        it in, parse is given an empty string.
+        """
+        state = self._git_state()
+        cached = self._git_cache.get(key)
+        if cached is not None and cached[0] == state:
+            callback(cached[1])
+            return
+
+        # Installed copies have no repository; don't start git just to hear it fail
+        if not self._has_git_repo():
+            value = parse('')
+            self._git_cache[key] = (state, value)
+            callback(value)
+            return
+
+        repo = self._git_repository() if read_repo else None
+        if repo is not None:
+            try:
+                value = read_repo(repo)
+            except Exception as e:
+                print(f"Error reading git repository: {e}")
+            else:
+                self._git_cache[key] = (state, value)
+                callback(value)
+                return
+
+        process = QProcess(self)
+
+        def finished(exit_code, exit_status):
+            output = ''
+            if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+                output = bytes(process.readAllStandardOutput()).decode('utf-8', 'replace')
+            else:
+                error = bytes(process.readAllStandardError()).decode('utf-8', 'replace').strip()
+                if error:
+                    print(f"Error running git {args[0]}: {error}")
+            process.deleteLater()
+            value = parse(output)
+            self._git_cache[key] = (state, value)
+            callback(value)
+
+        def error_occurred(error):
+            # finished is never emitted when git could not be started at all
+            if error == QProcess.ProcessError.FailedToStart:
+                print(f"Error running git {args[0]}: {process.errorString()}")
+                process.deleteLater()
+                callback(parse(''))
+
+        process.finished.connect(finished)
+        process.errorOccurred.connect(error_occurred)
+        process.start('git', args)
 
     def show_about(self):
-        """Show about dialog with application information"""
+        """Show about dialog with application information, building it on first use"""
+        if self._about_dialog is None:
+            self._about_dialog = self.create_about_dialog()
+        self._about_date_label.setText(f"<p>Current Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
+        # Filled in once git answers; served from the cache while the repository is unchanged
+        self.get_last_commit_date(
+            lambda date: self._about_label.setText(ABOUT_HTML.format(last_commit=date)))
+        self._about_dialog.exec()
+
+    def create_about_dialog(self):
+        """Create and return the about dialog"""
         about_dialog = QDialog(self)
         about_dialog.setWindowTitle("About Spidy")
         about_dialog.resize(400, 400)  # Slightly larger for the new button
         
-        # Try to get git commit information
-        last_commit = "Unknown"
-        try:
-            last_commit = subprocess.check_output(
-                ['git', 'log', '-1', '--format=%cd', '--date=iso'],
-                text=True, stderr=subprocess.PIPE
-            ).strip()
-        except:
-            pass  # Silently handle any errors
-            
         layout = QVBoxLayout()
         layout.addWidget(QLabel("<h2>Spidy Web Browser</h2>"))
-        layout.addWidget(QLabel(f"""
-            <p style="text-align: center;">
-                <b>Version:</b> 1.0.0<br>
-                <b>Author:</b> Spidy Project Team<br>
-                <b>License:</b> MIT
-            </p>
-            
-            <p>
-                A standards-based, open-source web browser built with Python and PyQt6.
-                Provides browsing functionality, bookmarks, history tracking, and statistics.
-            </p>
-            
-            <h3>Features</h3>
-            <ul>
-                <li>Multiple tab support</li>
-                <li>Bookmark management</li>
-                <li>Browsing history</li>
-                <li>Markdown file rendering</li>
-                <li>Page zoom functionality</li>
-                <li>Security-focused navigation</li>
-            </ul>
-            
-            <p>Last Commit: {last_commit}</p>
-            <p>Current Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>&copy; 2025 Spidy Project</p>
-        """))
+        # The last commit date is filled in by show_about
+        self._about_label = QLabel(ABOUT_HTML.format(last_commit="Loading…"))
+        layout.addWidget(self._about_label)
+        # The current date is refreshed by show_about each time the dialog opens
+        self._about_date_label = QLabel()
+        layout.addWidget(self._about_date_label)
+        layout.addWidget(QLabel("<p>&copy; 2025 Spidy Project</p>"))
         
         # Add button to view commit history
         history_button = QPushButton("View Commit and Release History")
@@ -321,11 +577,13 @@ class Browser(QMainWindow):
         layout.addWidget(button_box)
         
         about_dialog.setLayout(layout)
-        about_dialog.exec()
+        return about_dialog
         
     def show_release_history(self):
         """Show detailed commit and release history"""
         history_dialog = QDialog(self)
+        # Free the dialog and its child widgets once it is closed
+        history_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         history_dialog.setWindowTitle("Spidy Commit and Release History")
         history_dialog.resize(700, 500)
         
@@ -334,78 +592,75 @@ class Browser(QMainWindow):
         # Add heading
         layout.addWidget(QLabel("<h2>Spidy Browser Commit and Release History</h2>"))
         
-        # Get repository URL if available
-        repo_url = self.get_github_repo_url()
-        if repo_url:
-            link_label = QLabel(f'<p>Repository: <a href="{repo_url}">{repo_url}</a></p>')
-            link_label.setOpenExternalLinks(True)
-            layout.addWidget(link_label)
-        
-        # Add releases section if tags exist
-        tags = self.get_git_tags()
-        if tags:
-            layout.addWidget(QLabel("<h3>Release History</h3>"))
-            
-            releases_text = "<ul>"
-            for tag in tags:
-                releases_text += f"""
-                    <li>
-                        <b>{tag['name']}</b> ({tag['date']})<br>
-                        <span style="color: #666; font-family: monospace;">Commit: {tag['commit_hash']}</span>
-                    </li>
-                """
-            releases_text += "</ul>"
-            
-            layout.addWidget(QLabel(releases_text))
-        else:
-            layout.addWidget(QLabel("<p>No release tags found in the repository.</p>"))
+        # The dialog opens with placeholders that are filled in as git answers
+        link_label = QLabel()
+        link_label.setOpenExternalLinks(True)
+        link_label.hide()
+        layout.addWidget(link_label)
         
-        # Add commit history section
-        commits = self.get_git_commits(20)  # Get 20 most recent commits
+        releases_label = QLabel("<p>Loading release history…</p>")
+        layout.addWidget(releases_label)
         
-        if commits:
-            layout.addWidget(QLabel("<h3>Recent Commits</h3>"))
-            
-            # Create a widget to hold the commits
-            scroll_content = QWidget()
-            scroll_layout = QVBoxLayout(scroll_content)
-            
+        layout.addWidget(QLabel("<h3>Recent Commits</h3>"))
+        
+        # A text browser lays out the commit list lazily, scrolls it and opens links itself
+        commits_view = QTextBrowser()
+        commits_view.setOpenExternalLinks(True)
+        commits_view.setHtml("<p>Loading commit history…</p>")
+        commits_view.setMinimumHeight(250)
+        layout.addWidget(commits_view)
+        
+        # Git may answer after the dialog was closed and deleted; its results are
+        # still cached, but the widgets must not be touched any more
+        dialog_open = True
+        
+        def dialog_finished():
+            nonlocal dialog_open
+            dialog_open = False
+        
+        history_dialog.finished.connect(dialog_finished)
+        
+        def show_tags(tags):
+            if not dialog_open:
+                return
+            if tags:
+                parts = ["<h3>Release History</h3><ul>"]
+                for tag in tags:
+                    parts.append(RELEASE_TAG_HTML.format(**tag))
+                parts.append("</ul>")
+                releases_label.setText(''.join(parts))
+            else:
+                releases_label.setText("<p>No release tags found in the repository.</p>")
+        
+        def show_commits(commits, repo_url):
+            if not dialog_open:
+                return
+            if not commits:
+                commits_view.setHtml("<p>No commit history found or unable to retrieve commits.</p>")
+                return
             # Generate commit history HTML
-            commits_html = "<ul style='margin-left: 0; padding-left: 15px;'>"
+            parts = ["<ul style='margin-left: 0; padding-left: 15px;'>"]
             for commit in commits:
-                # Create a clean display of the commit info with styling
-                commit_url = f"{repo_url}/commit/{commit['hash']}" if repo_url else None
-                
-                if commit_url:
-                    hash_display = f"""<a href="{commit_url}" style="font-family: monospace; 
-                                       text-decoration: none; color: #0366d6;">{commit['hash']}</a>"""
+                # Link each hash to its commit page when the repository URL is known
+                if repo_url:
+                    hash_display = COMMIT_HASH_LINK_HTML.format(repo_url=repo_url, hash=commit['hash'])
                 else:
-                    hash_display = f"""<span style="font-family: monospace; color: #666;">
-                                      {commit['hash']}</span>"""
-                    
-                commits_html += f"""
-                    <li style="margin-bottom: 10px;">
-                        <div>
-                            <b>{commit['message']}</b><br>
-                            {hash_display} - <span style="color: #666;">{commit['date']}</span><br>
-                            <span style="color: #0b0;">Author:</span> {commit['author']}
-                        </div>
-                    </li>
-                """
-            commits_html += "</ul>"
-            commits_label = QLabel(commits_html)
-            commits_label.setOpenExternalLinks(True)
-            commits_label.setWordWrap(True)
-            scroll_layout.addWidget(commits_label)
-            
-            # Create a scroll area for the commits
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setWidget(scroll_content)
-            scroll_area.setMinimumHeight(250)
-            layout.addWidget(scroll_area)
-        else:
-            layout.addWidget(QLabel("<p>No commit history found or unable to retrieve commits.</p>"))
+                    hash_display = COMMIT_HASH_TEXT_HTML.format(hash=commit['hash'])
+                parts.append(COMMIT_ITEM_HTML.format(**commit, hash_display=hash_display))
+            parts.append("</ul>")
+            commits_view.setHtml(''.join(parts))
+        
+        def show_repo_url(repo_url):
+            if not dialog_open:
+                return
+            if repo_url:
+                link_label.setText(f'<p>Repository: <a href="{repo_url}">{repo_url}</a></p>')
+                link_label.show()
+            # Commit hashes link to the repository, so commits are fetched once its URL is known
+            self.get_git_tags(show_tags)
+            self.get_git_commits(20, lambda commits: show_commits(commits, repo_url))  # 20 most recent
+        
+        self.get_github_repo_url(show_repo_url)
         
         # Add close button
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
@@ -15,15 +15,13 @@ def __init__(self):
     
     # Initialize configuration directory
     self.config_dir = self.config.config_dir
-    if not os.path.exists(self.config_dir):
-        os.makedirs(self.config_dir)
+    os.makedirs(self.config_dir, exist_ok=True)
         
     # Create cache directory if specified
     cache_dir = self.config.get("General", "cache_dir", "")
     if not cache_dir:
         cache_dir = os.path.join(self.config_dir, "cache")
-    if not os.path.exists(cache_dir):
-        os.makedirs(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
 
     # Create central widget
     self.central_widget = QWidget()
@@ -99,6 +97,13 @@ def closeEvent(self, event):
     
     super().closeEvent(event)
 
+# Add at module level: configuration dialog buttons and the Browser methods they call
+CONFIG_ACTIONS = (
+    ("Open Config File", "open_config_file"),
+    ("Reload Config", "reload_config"),
+    ("Save Config", "save_config"),
+)
+
 # Add new methods to Browser class for configuration management:
 def show_config(self):
     """Show configuration dialog"""
@@ -150,32 +155,17 @@ def show_config(self):
     </ul>
     """
     
-    config_label = QLabel(config_text)
-    config_label.setWordWrap(True)
-    
-    scroll_area = QScrollArea()
-    scroll_area.setWidgetResizable(True)
-    scroll_content = QWidget()
-    scroll_layout = QVBoxLayout(scroll_content)
-    scroll_layout.addWidget(config_label)
-    scroll_area.setWidget(scroll_content)
-    
-    layout.addWidget(scroll_area)
+    # A text browser scrolls the configuration and re-wraps it on resize by itself
+    config_view = QTextBrowser()
+    config_view.setHtml(config_text)
+    layout.addWidget(config_view)
 
     # Add buttons
     buttons_layout = QHBoxLayout()
-    
-    open_config_button = QPushButton("Open Config File")
-    open_config_button.clicked.connect(self.open_config_file)
-    buttons_layout.addWidget(open_config_button)
-    
-    reload_config_button = QPushButton("Reload Config")
-    reload_config_button.clicked.connect(self.reload_config)
-    buttons_layout.addWidget(reload_config_button)
-    
-    save_config_button = QPushButton("Save Config")
-    save_config_button.clicked.connect(self.save_config)
-    buttons_layout.addWidget(save_config_button)
+    for label, handler_name in CONFIG_ACTIONS:
+        button = QPushButton(label)
+        button.clicked.connect(getattr(self, handler_name))
+        buttons_layout.addWidget(button)
     
     layout.addLayout(buttons_layout)
     
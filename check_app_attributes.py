@@ -1,8 +1,12 @@
 import sys
 from PyQt6.QtCore import Qt
 
-# Print all available ApplicationAttribute enum values
-print("Available Qt.ApplicationAttribute values:")
-for name in dir(Qt.ApplicationAttribute):
-    if not name.startswith('_'):
-        print(name)
+def main():
+    # Print all available ApplicationAttribute enum values
+    print("Available Qt.ApplicationAttribute values:")
+    for name in dir(Qt.ApplicationAttribute):
+        if not name.startswith('_'):
+            print(name)
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,12 @@ import sys
 from PyQt6.QtCore import Qt
 from PyQt6.QtWebEngineCore import QWebEngineGlobalSettings
 
-# Print all available methods in QWebEngineGlobalSettings
-print("Available QWebEngineGlobalSettings methods:")
-for name in dir(QWebEngineGlobalSettings):
-    if not name.startswith('_'):
-        print(name)
+def main():
+    # Print all available methods in QWebEngineGlobalSettings
+    print("Available QWebEngineGlobalSettings methods:")
+    for name in dir(QWebEngineGlobalSettings):
+        if not name.startswith('_'):
+            print(name)
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,12 @@ import sys
 from PyQt6.QtCore import Qt
 from PyQt6.QtWebEngineCore import QWebEngineSettings
 
-# Print all available methods in QWebEngineSettings
-print("Available QWebEngineSettings methods:")
-for name in dir(QWebEngineSettings):
-    if not name.startswith('_'):
-        print(name)
+def main():
+    # Print all available methods in QWebEngineSettings
+    print("Available QWebEngineSettings methods:")
+    for name in dir(QWebEngineSettings):
+        if not name.startswith('_'):
+            print(name)
+
+if __name__ == '__main__':
+    main()
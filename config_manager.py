@@ -11,10 +11,70 @@ Configuration values can be retrieved with a simple API and are cached for perfo
 """
 
 import os
+import re
 import sys
 import configparser
 from typing import Any, Dict, Optional, List, Set
 
+# Patterns for config.ini lines, matched against the stripped line like configparser does
+_SECTION_RE = re.compile(r'\[(?P<header>.+)\]')
+_OPTION_RE = re.compile(r'(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$')
+
+def parse_ini(text: str, errors: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Parse INI text into a {section: {option: value}} dictionary.
+
+    Follows configparser's reading rules for its default settings: full-line
+    comments start with '#' or ';', lines indented deeper than the option
+    they follow continue its value, and option names are lowercased.
+    Unlike configparser, problems never abort the parse: invalid lines and
+    options outside a section are skipped, and a repeated section or option
+    is merged with later values winning. Each problem is described in
+    errors, if a list is given.
+    """
+    sections = {}
+    values = {}  # (section, option) -> list of value lines
+    seen = set()
+    options = None
+    section = option = None
+    indent_level = 0
+    for line_number, line in enumerate(text.split('\n'), start=1):
+        value = line.strip()
+        if not value or value[0] in '#;':
+            # Blank lines belong to a value being continued; comments are skipped
+            if not value and option is not None:
+                values[section, option].append('')
+            continue
+        cur_indent_level = len(line) - len(line.lstrip())
+        if option is not None and cur_indent_level > indent_level:
+            values[section, option].append(value)
+            continue
+        indent_level = cur_indent_level
+        header = _SECTION_RE.match(value)
+        if header:
+            section = header.group('header')
+            if section in seen and errors is not None:
+                errors.append(f"line {line_number}: duplicate section [{section}]")
+            seen.add(section)
+            options = sections.setdefault(section, {})
+            option = None
+            continue
+        match = _OPTION_RE.match(value)
+        if options is None or not match or not match.group('option'):
+            if errors is not None:
+                errors.append(f"line {line_number}: cannot parse {value!r}")
+            continue
+        option = match.group('option').lower()
+        if (section, option) in seen and errors is not None:
+            errors.append(f"line {line_number}: duplicate option {option!r} in [{section}]")
+        seen.add((section, option))
+        options[option] = None
+        values[section, option] = [match.group('value').strip()]
+    # Continuation lines are joined with newlines like configparser does
+    for (section, option), lines in values.items():
+        sections[section][option] = '\n'.join(lines).rstrip()
+    return sections
+
 class ConfigManager:
     """Manages application configuration with multiple source support"""
     
@@ -28,6 +88,9 @@ class ConfigManager:
     SECTION_NETWORK = "Network"
     SECTION_PRIVACY = "Privacy"
     
+    # Accepted spellings of boolean values, as understood by configparser
+    BOOLEAN_STATES = configparser.ConfigParser.BOOLEAN_STATES
+    
     # Default configuration values
     DEFAULT_CONFIG = {
         SECTION_GENERAL: {
@@ -66,20 +129,15 @@ class ConfigManager:
             self.config_dir = config_dir
             
         # Ensure config directory exists
-        if not os.path.exists(self.config_dir):
-            os.makedirs(self.config_dir)
+        os.makedirs(self.config_dir, exist_ok=True)
             
         # Set paths
         self.config_path = os.path.join(self.config_dir, 'config.ini')
         
-        # Initialize configuration parser
-        self.config = configparser.ConfigParser()
-        
-        # Initialize with default values
-        for section, options in self.DEFAULT_CONFIG.items():
-            self.config[section] = {}
-            for option, value in options.items():
-                self.config[section][option] = value
+        # Configuration values by section and option, initialized with the defaults
+        self.config: Dict[str, Dict[str, str]] = {
+            section: dict(options) for section, options in self.DEFAULT_CONFIG.items()
+        }
         
         # Load configuration from file if it exists
         self.load_config()
@@ -92,18 +150,30 @@ class ConfigManager:
         
     def load_config(self) -> None:
         """Load configuration from config.ini file"""
-        if os.path.exists(self.config_path):
-            try:
-                self.config.read(self.config_path)
-                print(f"Loaded configuration from {self.config_path}")
-            except Exception as e:
-                print(f"Error loading configuration: {e}")
+        errors = []
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as config_file:
+                sections = parse_ini(config_file.read(), errors)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error loading configuration: {e}")
+            return
+        # Problems are reported, but the options that could be read still apply
+        if errors:
+            print(f"Error loading configuration from {self.config_path}: {'; '.join(errors)}")
+        for section, options in sections.items():
+            self.config.setdefault(section, {}).update(options)
+        print(f"Loaded configuration from {self.config_path}")
                 
     def save_config(self) -> None:
         """Save current configuration to config.ini file"""
         try:
-            with open(self.config_path, 'w') as config_file:
-                self.config.write(config_file)
+            # configparser is only used to write the file
+            parser = configparser.ConfigParser(interpolation=None)
+            parser.read_dict(self.config)
+            with open(self.config_path, 'w', encoding='utf-8') as config_file:
+                parser.write(config_file)
             print(f"Saved configuration to {self.config_path}")
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -146,6 +216,7 @@ class ConfigManager:
                 if '.' in setting:
                     section, option = setting.split('.', 1)
                     section = section.title()  # Convert to title case to match section names
+                    option = option.lower()    # Option names are stored lowercased
                     
                     # Set the configuration value if the section and option exist
                     if section in self.config and option in self.config[section]:
@@ -155,39 +226,35 @@ class ConfigManager:
     def get(self, section: str, option: str, fallback: Any = None) -> Any:
         """Get a configuration value with fallback"""
         try:
-            return self.config[section][option]
-        except (KeyError, configparser.NoSectionError, configparser.NoOptionError):
+            return self.config[section][option.lower()]
+        except KeyError:
             return fallback
     
     def get_boolean(self, section: str, option: str, fallback: bool = False) -> bool:
         """Get a boolean configuration value"""
         try:
-            return self.config.getboolean(section, option)
-        except (ValueError, KeyError, configparser.NoSectionError, configparser.NoOptionError):
+            return self.BOOLEAN_STATES[self.config[section][option.lower()].lower()]
+        except KeyError:
             return fallback
     
     def get_int(self, section: str, option: str, fallback: int = 0) -> int:
         """Get an integer configuration value"""
         try:
-            return self.config.getint(section, option)
-        except (ValueError, KeyError, configparser.NoSectionError, configparser.NoOptionError):
+            return int(self.config[section][option.lower()])
+        except (ValueError, KeyError):
             return fallback
     
     def get_float(self, section: str, option: str, fallback: float = 0.0) -> float:
         """Get a float configuration value"""
         try:
-            return self.config.getfloat(section, option)
-        except (ValueError, KeyError, configparser.NoSectionError, configparser.NoOptionError):
+            return float(self.config[section][option.lower()])
+        except (ValueError, KeyError):
             return fallback
     
     def set(self, section: str, option: str, value: Any) -> None:
         """Set a configuration value"""
-        # Ensure section exists
-        if section not in self.config:
-            self.config[section] = {}
-        
-        # Set the value
-        self.config[section][option] = str(value)
+        # Ensure section exists and set the value; option names are case-insensitive
+        self.config.setdefault(section, {})[option.lower()] = str(value)
     
     def create_default_config(self) -> None:
         """Create default configuration file if it doesn't exist"""
@@ -236,10 +303,10 @@ class ConfigManager:
     def __str__(self) -> str:
         """String representation of the configuration"""
         result = []
-        for section in self.config.sections():
+        for section, options in self.config.items():
             result.append(f"[{section}]")
-            for option in self.config[section]:
-                result.append(f"{option} = {self.config[section][option]}")
+            for option, value in options.items():
+                result.append(f"{option} = {value}")
             result.append("")
         return "\n".join(result)
 
@@ -14,7 +14,7 @@ import logging
 import re
 
 from PyQt6.QtCore import QUrl, QObject, pyqtSignal, pyqtSlot
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings, QWebEngineScript
 from PyQt6.QtWebChannel import QWebChannel
 
 try:
@@ -23,6 +23,12 @@ try:
 except ImportError:
     HTML_CLEANER_AVAILABLE = False
 
+# Directory containing this module, resolved once at import time
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Verbose per-navigation tracing is off unless SPIDY_DEBUG=1 is set
+DEBUG_NAVIGATION = os.environ.get('SPIDY_DEBUG') == '1'
+
 
 class LinkHandler(QWebEnginePage):
     """
@@ -48,6 +54,11 @@ class LinkHandler(QWebEnginePage):
         QWebEnginePage.NavigationType.NavigationTypeTyped: "URL Typed",
         QWebEnginePage.NavigationType.NavigationTypeOther: "Other Navigation"
     }
+    # Log message templates for navigation types that get an INFO line
+    NAV_TYPE_LOG_FORMAT = {
+        QWebEnginePage.NavigationType.NavigationTypeLinkClicked: "Link clicked: {}",
+        QWebEnginePage.NavigationType.NavigationTypeFormSubmitted: "Form submitted to {}",
+    }
     # Define supported URL schemes with handling policies
     SUPPORTED_SCHEMES = {
         'http': {'allow': True, 'description': 'HTTP protocol'},
@@ -62,63 +73,8 @@ class LinkHandler(QWebEnginePage):
     }
     # Define potentially dangerous schemes
     SUSPICIOUS_SCHEMES = ['javascript', 'vbscript', 'data']
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Create profile that allows local file access
-        self.profile = QWebEngineProfile.defaultProfile()
-        self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies)
-        # Enable ALL required settings
-        settings = self.settings()
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowWindowActivationFromJavaScript, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.ErrorPageEnabled, True)
-        
-        # Setup HTML cleaner if available
-        self.html_cleaner = HTMLCleaner() if HTML_CLEANER_AVAILABLE else None
-        
-        # Pre-configure JavaScript polyfills and page monitoring
-        self.loadStarted.connect(self._inject_polyfills)
-        self.loadFinished.connect(self._check_for_base_tag)
-        self.loadFinished.connect(self._inject_link_handlers)
-        self.loadFinished.connect(self._setup_web_channel)
-        
-        # Initialize navigation history tracking
-        self.navigation_history = []
-        self.nav_success_count = 0
-        self.nav_failure_count = 0
-        self.current_nav_start_time = 0
-        self.suspicious_navigation_attempts = 0
-        # Signal for handling special URL loading after navigation
-        self.pending_data_url = None
-        
-        # Store base tag information
-        self.has_base_tag = False
-        self.base_target = None
-        
-        # Configure logging
-        self.logger = logging.getLogger('spidy.link_handler')
-        
-        # Store the original javaScriptConsoleMessage method before overriding
-        self._original_js_console_handler = self.javaScriptConsoleMessage
-        
-        # Handle JavaScript communication
-        self.javaScriptConsoleMessage = self._enhanced_js_console_handler
-        
-        # Set up the web channel for JavaScript-Python communication
-        self.web_channel = QWebChannel(self)
-        self.web_channel.registerObject("pyObject", self)
-        self.setWebChannel(self.web_channel)
-        
-    def _inject_polyfills(self):
-        """Inject required JavaScript polyfills"""
-        polyfills = """
+    # JavaScript polyfills and Spidy helpers installed into every frame
+    POLYFILLS_JS = """
             // String.replaceAll polyfill
             if (!String.prototype.replaceAll) {
                 String.prototype.replaceAll = function(str, newStr) {
@@ -179,8 +135,78 @@ class LinkHandler(QWebEnginePage):
                 }
                 return { found: false };
             };
-            
         """
+    # Set once the shared default profile has been configured
+    _profile_configured = False
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Create profile that allows local file access
+        self.profile = QWebEngineProfile.defaultProfile()
+        # The profile is shared by every page, so configure it only once
+        if not LinkHandler._profile_configured:
+            self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies)
+            # Enable ALL required settings
+            settings = self.profile.settings()
+            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.AllowWindowActivationFromJavaScript, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
+            settings.setAttribute(QWebEngineSettings.WebAttribute.ErrorPageEnabled, True)
+            # Install the polyfills as a profile script so Qt injects them into
+            # each new document itself, instead of per page load from Python
+            polyfills = QWebEngineScript()
+            polyfills.setName("spidy-polyfills")
+            polyfills.setSourceCode(self.POLYFILLS_JS)
+            polyfills.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+            polyfills.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+            polyfills.setRunsOnSubFrames(True)
+            self.profile.scripts().insert(polyfills)
+            LinkHandler._profile_configured = True
+        
+        # Setup HTML cleaner if available
+        self.html_cleaner = HTMLCleaner() if HTML_CLEANER_AVAILABLE else None
+        
+        # Page monitoring
+        self.loadFinished.connect(self._check_for_base_tag)
+        self.loadFinished.connect(self._inject_link_handlers)
+        self.loadFinished.connect(self._setup_web_channel)
+        
+        # Initialize navigation history tracking
+        # "all" records every attempt, "failures_only" keeps just failed ones
+        self.record_history_level = "all"
+        self.navigation_history = []
+        self.nav_success_count = 0
+        self.nav_failure_count = 0
+        self.current_nav_start_time = 0
+        self.suspicious_navigation_attempts = 0
+        # Running totals for the average successful navigation duration
+        self._duration_sum = 0.0
+        self._duration_count = 0
+        # Signal for handling special URL loading after navigation
+        self.pending_data_url = None
+        
+        # Store base tag information
+        self.has_base_tag = False
+        self.base_target = None
+        
+        # Configure logging
+        self.logger = logging.getLogger('spidy.link_handler')
+        
+        # Store the original javaScriptConsoleMessage method before overriding
+        self._original_js_console_handler = self.javaScriptConsoleMessage
+        
+        # Handle JavaScript communication
+        self.javaScriptConsoleMessage = self._enhanced_js_console_handler
+        
+        # Set up the web channel for JavaScript-Python communication
+        self.web_channel = QWebChannel(self)
+        self.web_channel.registerObject("pyObject", self)
+        self.setWebChannel(self.web_channel)
         
     def _check_for_base_tag(self, ok):
         """Check if page has a base tag with target attribute"""
@@ -440,20 +466,25 @@ class LinkHandler(QWebEnginePage):
 
     def log_navigation(self, message, level="INFO"):
         """Log navigation events with timestamp and level"""
+        if level == "DEBUG" and not DEBUG_NAVIGATION:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
         print(f"[{timestamp}] [{level}] {message}")
 
     def get_navigation_type_name(self, nav_type):
         """Get readable name for navigation type"""
-        return self.NAV_TYPE_NAMES.get(nav_type, f"Unknown ({nav_type})")
+        name = self.NAV_TYPE_NAMES.get(nav_type)
+        return name if name is not None else f"Unknown ({nav_type})"
 
     def is_suspicious_url(self, url):
         """Check if URL might be suspicious or malicious"""
         suspicious = False
         reasons = []
         
-        # Check scheme
-        scheme = url.scheme().lower()
+        # Check scheme (QUrl normally hands back an already lowercase scheme)
+        scheme = url.scheme()
+        if not scheme.islower():
+            scheme = scheme.lower()
         if scheme in self.SUSPICIOUS_SCHEMES:
             suspicious = True
             reasons.append(f"Suspicious scheme: {scheme}")
@@ -477,8 +508,18 @@ class LinkHandler(QWebEnginePage):
         """Record a navigation attempt in the history"""
         end_time = time.time()
         duration = round((end_time - self.current_nav_start_time) * 1000, 2) if self.current_nav_start_time > 0 else 0
+        if success:
+            self.nav_success_count += 1
+            if duration > 0:
+                self._duration_sum += duration
+                self._duration_count += 1
+            # Successful navigations only feed the counters in "failures_only" mode
+            if self.record_history_level == "failures_only":
+                return
+        else:
+            self.nav_failure_count += 1
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(end_time).isoformat(),
             "url": url.toString(),
             "navigation_type": str(nav_type),
             "is_main_frame": is_main_frame,
@@ -502,13 +543,8 @@ class LinkHandler(QWebEnginePage):
         """Get statistics about navigation history"""
         total = self.nav_success_count + self.nav_failure_count
         success_rate = (self.nav_success_count / total * 100) if total > 0 else 0
-        # Calculate average duration for successful navigations
-        durations = [
-            entry.get('duration_ms', 0) 
-            for entry in self.nav_history
-            if entry.get('success', False) and entry.get('duration_ms', 0) > 0
-        ]
-        avg_duration = sum(durations) / len(durations) if durations else 0
+        # Average duration for successful navigations, from running totals
+        avg_duration = self._duration_sum / self._duration_count if self._duration_count else 0
         return {
             "total_navigations": total,
             "successful": self.nav_success_count,
@@ -566,12 +602,13 @@ class LinkHandler(QWebEnginePage):
         nav_type_name = self.get_navigation_type_name(nav_type)
         
         # Enhanced structured debug logging
-        self.log_navigation("\nNavigation Request Details:", "DEBUG")
-        self.log_navigation(f"URL: {url.toString()}", "DEBUG")
-        self.log_navigation(f"Type: {nav_type} ({nav_type_name})", "DEBUG")
-        self.log_navigation(f"Is Main Frame: {is_main_frame}", "DEBUG")
-        self.log_navigation(f"URL Scheme: {url.scheme()}", "DEBUG")
-        self.log_navigation(f"Has base tag: {self.has_base_tag}, target: {self.base_target}", "DEBUG")
+        if DEBUG_NAVIGATION:
+            self.log_navigation("\nNavigation Request Details:", "DEBUG")
+            self.log_navigation(f"URL: {url.toString()}", "DEBUG")
+            self.log_navigation(f"Type: {nav_type} ({nav_type_name})", "DEBUG")
+            self.log_navigation(f"Is Main Frame: {is_main_frame}", "DEBUG")
+            self.log_navigation(f"URL Scheme: {url.scheme()}", "DEBUG")
+            self.log_navigation(f"Has base tag: {self.has_base_tag}, target: {self.base_target}", "DEBUG")
         
         # Handle our custom spidy-md:// protocol for Markdown navigation
         if url.scheme() == 'spidy-md':
@@ -627,12 +664,14 @@ class LinkHandler(QWebEnginePage):
         is_suspicious, reasons = self.is_suspicious_url(url)
         if is_suspicious:
             self.suspicious_navigation_attempts += 1
-            self.log_navigation(f"SECURITY WARNING: Potentially suspicious URL detected:", "WARNING")
-            for reason in reasons:
-                self.log_navigation(f"- {reason}", "WARNING")
+            self.log_navigation(
+                "SECURITY WARNING: Potentially suspicious URL detected:\n  - " + "\n  - ".join(reasons),
+                "WARNING")
         
-        # Get the URL scheme for handling
-        scheme = url.scheme().lower()
+        # Get the URL scheme for handling (QUrl normally hands back an already lowercase scheme)
+        scheme = url.scheme()
+        if not scheme.islower():
+            scheme = scheme.lower()
         
         # Special case for main frame navigation to Markdown files
         if is_main_frame and scheme == 'file' and url.toString().lower().endswith('.md'):
@@ -679,9 +718,10 @@ class LinkHandler(QWebEnginePage):
             self.record_navigation_attempt(url, nav_type, is_main_frame, True)
             return True
         # Handle different navigation types
+        nav_log_format = self.NAV_TYPE_LOG_FORMAT.get(nav_type)
+        if nav_log_format is not None:
+            self.log_navigation(nav_log_format.format(url.toString()), "INFO")
         if nav_type == QWebEnginePage.NavigationType.NavigationTypeLinkClicked:
-            self.log_navigation(f"Link clicked: {url.toString()}", "INFO")
-            
             # Check if this link should open in a new tab because of <base target="_blank">
             if self.has_base_tag and self.base_target == "_blank":
                 self.log_navigation(f"Link should open in new tab due to <base target=\"_blank\">", "INFO")
@@ -691,109 +731,118 @@ class LinkHandler(QWebEnginePage):
             # Run a JavaScript check for link target
             self.check_link_target(url)
                 
-        elif nav_type == QWebEnginePage.NavigationType.NavigationTypeFormSubmitted:
-            self.log_navigation(f"Form submitted to {url.toString()}", "INFO")
         # Process URL based on scheme
-        if scheme in self.SUPPORTED_SCHEMES:
-            scheme_info = self.SUPPORTED_SCHEMES[scheme]
-            # Check if scheme is allowed
-            if not scheme_info.get('allow', False):
-                self.log_navigation(f"Navigation blocked - scheme '{scheme}' is not allowed", "WARNING")
-                self.record_navigation_attempt(
-                    url, nav_type, is_main_frame, False, f"Scheme '{scheme}' is not allowed")
-                return False
-                
-            # Handle external schemes (mailto, tel, etc.)
-            if scheme_info.get('external', False):
-                self.log_navigation(
-                    f"External scheme '{scheme}' detected, attempting to open with external application", 
-                    "INFO")
-                # For mailto and tel links, you might integrate with system applications
-                # This is a simplified demonstration - in production, you might use QDesktopServices
-                self.record_navigation_attempt(
-                    url, nav_type, is_main_frame, True, "Handled by external application")
-                return False  # Don't navigate in browser, but consider it successful for tracking
-
-            # Handle specific schemes
-            if scheme == 'file':
-                path = url.toLocalFile()
-                self.log_navigation(f"Handling file URL: {path}", "DEBUG")
-                # Handle relative paths
-                if not os.path.isabs(path):
-                    base_dir = os.path.dirname(os.path.abspath(__file__))
-                # Debug the file path
-                self.log_navigation(f"Checking file path: {path}", "DEBUG")
-                self.log_navigation(f"File exists? {os.path.exists(path)}", "DEBUG")
-                
-                if os.path.exists(path):
-                    self.log_navigation(f"File exists, allowing navigation", "INFO")
-                    
-                    # For non-main frame, don't try to process Markdown (already handled in main frame handler)
-                    if not is_main_frame and path.lower().endswith('.md'):
-                        self.log_navigation(f"Non-main frame Markdown file detected but skipping special handling: {path}", "DEBUG")
-                    
-                    self.record_navigation_attempt(url, nav_type, is_main_frame, True)
-                    return True
-                    
-                # File doesn't exist - try fallback
-                self.log_navigation(f"File does not exist: {path}", "WARNING")
-                # Try fallback to HTTP if file not found
-                http_url = QUrl("http://" + url.fileName())
-                if http_url.isValid():
-                    self.log_navigation(f"Attempting fallback to HTTP: {http_url.toString()}", "INFO")
-                    self.record_navigation_attempt(
-                        url, nav_type, is_main_frame, True, "File not found, falling back to HTTP")
-                    return True
-                
-                # No fallback available
-                self.log_navigation(f"Navigation failed - file not found and no valid fallback", "ERROR")
-                self.record_navigation_attempt(
-                    url, nav_type, is_main_frame, False, "File not found and no valid fallback")
-                return False
-                
-            # Standard HTTP/HTTPS handling
-            elif scheme in ('http', 'https'):
-                self.log_navigation(f"Allowing navigation to {scheme} URL: {url.toString()}", "INFO")
-                self.record_navigation_attempt(url, nav_type, is_main_frame, True)
-                return True
-                
-            # FTP handling
-            elif scheme in ('ftp', 'ftps'):
-                self.log_navigation(f"Allowing navigation to {scheme} URL: {url.toString()}", "INFO")
-                self.record_navigation_attempt(url, nav_type, is_main_frame, True)
-                return True
-                
-            # Data URI scheme (inline content)
-            elif scheme == 'data':
-                self.log_navigation(f"Processing data URI", "INFO")
-                # Check if it's a potentially malicious data URI (e.g., executable content)
-                data_content = url.toString()
-                if 'application/x-msdownload' in data_content or 'application/octet-stream' in data_content:
-                    self.log_navigation("Potentially unsafe data URI with executable content", "WARNING")
-                    self.suspicious_navigation_attempts += 1
-                
-                self.record_navigation_attempt(url, nav_type, is_main_frame, True)
-                return True
-                
-            # Default handling for supported schemes
-            self.log_navigation(f"Allowing navigation to {scheme} URL via default handler", "INFO")
+        scheme_info = self.SUPPORTED_SCHEMES.get(scheme)
+        if scheme_info is None:
+            return self._handle_unsupported_scheme(url, scheme, nav_type, is_main_frame)
+
+        # Check if scheme is allowed
+        if not scheme_info.get('allow', False):
+            self.log_navigation(f"Navigation blocked - scheme '{scheme}' is not allowed", "WARNING")
+            self.record_navigation_attempt(
+                url, nav_type, is_main_frame, False, f"Scheme '{scheme}' is not allowed")
+            return False
+            
+        # Handle external schemes (mailto, tel, etc.)
+        if scheme_info.get('external', False):
+            self.log_navigation(
+                f"External scheme '{scheme}' detected, attempting to open with external application", 
+                "INFO")
+            # For mailto and tel links, you might integrate with system applications
+            # This is a simplified demonstration - in production, you might use QDesktopServices
+            self.record_navigation_attempt(
+                url, nav_type, is_main_frame, True, "Handled by external application")
+            return False  # Don't navigate in browser, but consider it successful for tracking
+
+        # Dispatch to the scheme-specific handler
+        handler = self._SCHEME_HANDLERS.get(scheme, LinkHandler._handle_default_scheme)
+        return handler(self, url, scheme, nav_type, is_main_frame)
+
+    def _handle_file_scheme(self, url, scheme, nav_type, is_main_frame):
+        """Handle navigation to a file:// URL"""
+        path = url.toLocalFile()
+        self.log_navigation(f"Handling file URL: {path}", "DEBUG")
+        # Handle relative paths
+        if not os.path.isabs(path):
+            base_dir = _MODULE_DIR
+        # Debug the file path
+        self.log_navigation(f"Checking file path: {path}", "DEBUG")
+        self.log_navigation(f"File exists? {os.path.exists(path)}", "DEBUG")
+        
+        if os.path.exists(path):
+            self.log_navigation(f"File exists, allowing navigation", "INFO")
+            
+            # For non-main frame, don't try to process Markdown (already handled in main frame handler)
+            if not is_main_frame and path.lower().endswith('.md'):
+                self.log_navigation(f"Non-main frame Markdown file detected but skipping special handling: {path}", "DEBUG")
+            
             self.record_navigation_attempt(url, nav_type, is_main_frame, True)
             return True
-                
-        else:
-            # Unsupported scheme
-            self.log_navigation(f"Unsupported URL scheme: {scheme}", "WARNING")
             
-            # If it's a known but unsupported scheme, log specifically
-            if scheme in ['javascript', 'vbscript']:
-                self.log_navigation(f"Script scheme '{scheme}' not supported for security reasons", "WARNING")
-                self.record_navigation_attempt(url, nav_type, is_main_frame, False, f"Script scheme '{scheme}' blocked")
-                return False
-                
-            # Unknown scheme - try anyway but log the attempt
-            self.log_navigation(f"Unknown scheme '{scheme}', attempting navigation with caution", "WARNING")
-            self.record_navigation_attempt(url, nav_type, is_main_frame, True, f"Unknown scheme '{scheme}' allowed with caution")
+        # File doesn't exist - try fallback
+        self.log_navigation(f"File does not exist: {path}", "WARNING")
+        # Try fallback to HTTP if file not found
+        http_url = QUrl("http://" + url.fileName())
+        if http_url.isValid():
+            self.log_navigation(f"Attempting fallback to HTTP: {http_url.toString()}", "INFO")
+            self.record_navigation_attempt(
+                url, nav_type, is_main_frame, True, "File not found, falling back to HTTP")
             return True
+        
+        # No fallback available
+        self.log_navigation(f"Navigation failed - file not found and no valid fallback", "ERROR")
+        self.record_navigation_attempt(
+            url, nav_type, is_main_frame, False, "File not found and no valid fallback")
+        return False
+
+    def _handle_network_scheme(self, url, scheme, nav_type, is_main_frame):
+        """Handle navigation to HTTP/HTTPS and FTP/FTPS URLs"""
+        self.log_navigation(f"Allowing navigation to {scheme} URL: {url.toString()}", "INFO")
+        self.record_navigation_attempt(url, nav_type, is_main_frame, True)
+        return True
+
+    def _handle_data_scheme(self, url, scheme, nav_type, is_main_frame):
+        """Handle navigation to a data: URI (inline content)"""
+        self.log_navigation(f"Processing data URI", "INFO")
+        # Check if it's a potentially malicious data URI (e.g., executable content)
+        data_content = url.toString()
+        if 'application/x-msdownload' in data_content or 'application/octet-stream' in data_content:
+            self.log_navigation("Potentially unsafe data URI with executable content", "WARNING")
+            self.suspicious_navigation_attempts += 1
+        
+        self.record_navigation_attempt(url, nav_type, is_main_frame, True)
+        return True
+
+    def _handle_default_scheme(self, url, scheme, nav_type, is_main_frame):
+        """Default handling for supported schemes without a dedicated handler"""
+        self.log_navigation(f"Allowing navigation to {scheme} URL via default handler", "INFO")
+        self.record_navigation_attempt(url, nav_type, is_main_frame, True)
+        return True
+
+    def _handle_unsupported_scheme(self, url, scheme, nav_type, is_main_frame):
+        """Handle navigation to a scheme not listed in SUPPORTED_SCHEMES"""
+        self.log_navigation(f"Unsupported URL scheme: {scheme}", "WARNING")
+        
+        # If it's a known but unsupported scheme, log specifically
+        if scheme in ['javascript', 'vbscript']:
+            self.log_navigation(f"Script scheme '{scheme}' not supported for security reasons", "WARNING")
+            self.record_navigation_attempt(url, nav_type, is_main_frame, False, f"Script scheme '{scheme}' blocked")
+            return False
+            
+        # Unknown scheme - try anyway but log the attempt
+        self.log_navigation(f"Unknown scheme '{scheme}', attempting navigation with caution", "WARNING")
+        self.record_navigation_attempt(url, nav_type, is_main_frame, True, f"Unknown scheme '{scheme}' allowed with caution")
+        return True
+
+    # Scheme-specific navigation handlers, looked up once per request
+    _SCHEME_HANDLERS = {
+        'file': _handle_file_scheme,
+        'http': _handle_network_scheme,
+        'https': _handle_network_scheme,
+        'ftp': _handle_network_scheme,
+        'ftps': _handle_network_scheme,
+        'data': _handle_data_scheme,
+    }
 
     def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
         """Handle JavaScript console messages with enhanced logging and filtering"""
@@ -31,8 +31,9 @@ def main():
     browser.show()
 
     # Save history and bookmarks on application exit
-    app.aboutToQuit.connect(browser.navigation_manager.save_history)
-    app.aboutToQuit.connect(browser.bookmark_manager.save_bookmarks)
+    app.aboutToQuit.connect(browser.navigation_manager.flush_history)
+    app.aboutToQuit.connect(browser.bookmark_manager.flush_bookmarks)
+    app.aboutToQuit.connect(browser.writer.close)
 
     # Start event loop
     sys.exit(app.exec())
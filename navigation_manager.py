@@ -5,18 +5,73 @@ Handles URL navigation, history tracking, and navigation-related UI updates.
 """
 
 import os
-import json
+from collections import OrderedDict
 from datetime import datetime
-from PyQt6.QtCore import QUrl
+from persistence import read_json, read_json_lines
+from PyQt6.QtCore import Qt, QUrl, QTimer, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTableView, QAbstractItemView
 from PyQt6.QtWidgets import QHeaderView, QDialogButtonBox, QMessageBox
 
+# Role looked up once here rather than through Qt's enum on every data() call
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+class HistoryTableModel(QAbstractTableModel):
+    """Read-only table model over a snapshot of history entries, newest first"""
+    HEADERS = ("Title", "URL", "Date/Time")
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != DISPLAY_ROLE or not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        column = index.column()
+        if column == 0:
+            return entry.get('title', '')
+        if column == 1:
+            return entry.get('url', '')
+        timestamp = entry.get('ts_display')
+        if timestamp is None:
+            # Older entries only carry the ISO timestamp
+            try:
+                timestamp = datetime.fromisoformat(entry.get('timestamp', '')).strftime('%Y-%m-%d %H:%M:%S')
+            except:
+                timestamp = "Unknown"
+        return timestamp
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 class NavigationManager:
+    # Delay used to coalesce bursts of history changes into a single write
+    HISTORY_SAVE_DELAY_MS = 1000
+    # Maximum number of history entries kept in memory and on disk
+    MAX_HISTORY_ENTRIES = 5000
+
     def __init__(self, browser):
         self.browser = browser
-        self.history = []
-        self.history_file = os.path.join(browser.config_dir, 'history.json')
+        # History entries keyed by URL, oldest first, so a revisit moves to the end in O(1)
+        self.history = OrderedDict()
+        # Cached (can_go_back, can_go_forward) per view, refreshed when its URL changes
+        self._nav_state = {}
+        # History is stored as JSON Lines (oldest first) so visits can be appended
+        self.history_file = os.path.join(browser.config_dir, 'history.jsonl')
+        self.legacy_history_file = os.path.join(browser.config_dir, 'history.json')
+        self._history_dirty = False
+        self._history_timer = QTimer()
+        self._history_timer.setSingleShot(True)
+        self._history_timer.timeout.connect(self.flush_history)
         self.load_history()
         
     def navigate_to_url(self):
@@ -56,42 +111,137 @@ class NavigationManager:
         """Update navigation button states for current tab"""
         current_view = self.browser.tab_manager.current_view()
         if current_view:
-            self.browser.back_button.setEnabled(current_view.page().history().canGoBack())
-            self.browser.forward_button.setEnabled(current_view.page().history().canGoForward())
+            state = self._nav_state.get(current_view)
+            if state is None:
+                state = self._query_navigation_state(current_view)
+            self._apply_navigation_state(state)
+
+    def refresh_navigation_state(self, view):
+        """Recompute the cached back/forward state of view after its URL changed"""
+        state = self._query_navigation_state(view)
+        if view == self.browser.tab_manager.current_view():
+            self._apply_navigation_state(state)
+
+    def discard_navigation_state(self, view):
+        """Forget the cached back/forward state of a closed view"""
+        self._nav_state.pop(view, None)
+
+    def _query_navigation_state(self, view):
+        """Ask the view's page history whether it can go back/forward and cache the result"""
+        history = view.page().history()
+        state = (history.canGoBack(), history.canGoForward())
+        self._nav_state[view] = state
+        return state
+
+    def _apply_navigation_state(self, state):
+        """Enable or disable the Back/Forward buttons"""
+        can_go_back, can_go_forward = state
+        self.browser.back_button.setEnabled(can_go_back)
+        self.browser.forward_button.setEnabled(can_go_forward)
 
     # History management methods
     def load_history(self):
         """Load browser history from config file"""
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    self.history = json.load(f)
+            records = read_json_lines(self.history_file)
+        except FileNotFoundError:
+            self._migrate_legacy_history()
+            return
         except Exception as e:
             print(f"Error loading history: {e}")
-            self.history = []
-    
-    def save_history(self):
-        """Save browser history to config file"""
+            self._set_history([])
+            return
+        # Compact the file once revisits or the size cap leave stale lines in it
+        if self._set_history(records):
+            self.save_history()
+
+    def _migrate_legacy_history(self):
+        """Load a history.json (newest first) written by older versions, if present"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            self._set_history(reversed(read_json(self.legacy_history_file)))
+        except FileNotFoundError:
+            return
         except Exception as e:
-            print(f"Error saving history: {e}")
+            print(f"Error loading history: {e}")
+            self._set_history([])
+            return
+        self.save_history()
+
+    def _set_history(self, records):
+        """
+        Replace the in-memory history with records given oldest first.
+
+        Only the most recent visit to each URL is kept, and at most
+        MAX_HISTORY_ENTRIES of the newest entries. Returns True if any
+        records were dropped.
+        """
+        history = OrderedDict()
+        count = 0
+        for entry in records:
+            url = entry.get('url')
+            history.pop(url, None)
+            history[url] = entry
+            count += 1
+        while len(history) > self.MAX_HISTORY_ENTRIES:
+            history.popitem(last=False)
+        self.history = history
+        return len(history) < count
+    
+    def save_history(self):
+        """Schedule browser history to be saved to config file"""
+        self._history_dirty = True
+        if not self._history_timer.isActive():
+            self._history_timer.start(self.HISTORY_SAVE_DELAY_MS)
+
+    def flush_history(self):
+        """Write pending history changes to config file immediately"""
+        self._history_timer.stop()
+        if not self._history_dirty:
+            return
+        self._history_dirty = False
+        # Hand a snapshot to the background writer so the GUI thread never blocks on disk I/O.
+        # Entries are copied too, since revisits and title updates mutate them in place
+        # while the writer thread may still be serializing.
+        self.browser.writer.write_json_lines(self.history_file,
+                                             [dict(entry) for entry in self.history.values()])
     
     def add_to_history(self, success, browser=None):
         """Add current page to history when loaded successfully"""
+        if not success:
+            return
         current_view = self.browser.tab_manager.current_view()
-        if success and (not browser or browser == current_view):
-            current_url = current_view.url().toString()
-            if current_url and current_url != "about:blank":
-                if not self.history or self.history[0].get('url') != current_url:
-                    self.history.insert(0, {
-                        'url': current_url,
-                        'title': current_view.title() or current_url,
-                        'timestamp': datetime.now().isoformat(),
-                        'visited': 1
-                    })
-                    self.save_history()
+        if not current_view or (browser and browser != current_view):
+            return
+        current_url = current_view.url().toString()
+        if not current_url or current_url == "about:blank":
+            return
+        # Reloading the most recent page leaves history untouched
+        if self.history and next(reversed(self.history)) == current_url:
+            return
+
+        now = datetime.now()
+        entry = self.history.get(current_url)
+        if entry is not None:
+            # Revisit: move the existing entry to the newest end
+            self.history.move_to_end(current_url)
+            entry['visited'] = entry.get('visited', 1) + 1
+            entry['timestamp'] = now.isoformat()
+            entry['ts_display'] = now.strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            entry = {
+                'url': current_url,
+                'title': current_view.title() or current_url,
+                'timestamp': now.isoformat(),
+                # Display form stored up front so the history dialog needn't parse it
+                'ts_display': now.strftime('%Y-%m-%d %H:%M:%S'),
+                'visited': 1
+            }
+            self.history[current_url] = entry
+            # Drop the oldest entry once the history is full
+            if len(self.history) > self.MAX_HISTORY_ENTRIES:
+                self.history.popitem(last=False)
+        # Append just the new visit instead of rewriting the whole file
+        self.browser.writer.append_json_line(self.history_file, dict(entry))
 
     def update_history_title(self, title, browser=None):
         """Update the title in history for the current URL"""
@@ -99,22 +249,25 @@ class NavigationManager:
         if not browser or browser == current_view:
             current_url = current_view.url().toString()
             # Update title in history for the current URL
-            for entry in self.history:
-                if entry.get('url') == current_url:
-                    entry['title'] = title
-                    self.save_history()
-                    break
+            entry = self.history.get(current_url)
+            if entry is not None and entry.get('title') != title:
+                entry['title'] = title
+                self.save_history()
 
     def create_history_dialog(self):
         """Create and return a dialog displaying the browser history"""
         dialog = QDialog(self.browser)
+        # Free the dialog and its child widgets once it is closed
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         dialog.setWindowTitle("Browsing History")
         dialog.resize(840, 520)
         
-        # Create table for history items
-        table = QTableWidget()
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Title", "URL", "Date/Time"])
+        # Create a table view over a snapshot of the history; cells are formatted
+        # on demand for visible rows instead of being copied into per-cell items
+        model = HistoryTableModel(list(reversed(self.history.values())), dialog)
+        table = QTableView()
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         
@@ -123,23 +276,9 @@ class NavigationManager:
         small_font.setPointSize(9)  # Adjust this value as needed
         table.setFont(small_font)
         
-        # Fill table with history items
-        table.setRowCount(len(self.history))
-        for i, entry in enumerate(self.history):
-            # Convert ISO timestamp to readable format
-            try:
-                timestamp = datetime.fromisoformat(entry.get('timestamp', '')).strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                timestamp = "Unknown"
-                
-            table.setItem(i, 0, QTableWidgetItem(entry.get('title', '')))
-            table.setItem(i, 1, QTableWidgetItem(entry.get('url', '')))
-            table.setItem(i, 2, QTableWidgetItem(timestamp))
-        
-        # Double-click on a history item loads that URL
         # Double-click on a history item loads that URL and closes the dialog
-        table.cellDoubleClicked.connect(lambda row, column: 
-                                       self.navigate_to_history_item(self.history[row], dialog))
+        table.doubleClicked.connect(lambda index:
+                                    self.navigate_to_history_item(model.entries[index.row()], dialog))
         
         # Layout
         layout = QVBoxLayout()
@@ -180,7 +319,7 @@ class NavigationManager:
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.history = []
+            self.history.clear()
             self.save_history()
             QMessageBox.information(self.browser, "History Cleared", 
                                   "All browsing history has been cleared.")
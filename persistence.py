@@ -0,0 +1,160 @@
+"""
+Persistence helpers for Spidy Web Browser
+
+Provides a background writer so history and bookmark files are serialized
+and written without blocking the GUI thread.
+"""
+
+import json
+import mmap
+import os
+import queue
+import threading
+
+# Use orjson for serialization if it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files larger than this are memory-mapped when read
+MMAP_THRESHOLD = 256 * 1024
+
+
+def dumps(data):
+    """Serialize data to compact UTF-8 encoded JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path):
+    """
+    Read a JSON document from path.
+
+    The file is read into memory in one call and parsed from that buffer;
+    files above MMAP_THRESHOLD are memory-mapped instead when orjson, which
+    parses straight from the mapping, is available.
+    """
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.path.getsize(path) > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def write_json(path, data):
+    """
+    Serialize data as compact JSON and atomically replace path with it.
+
+    The data is written to a temporary file next to path and renamed over it,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps(data))
+    os.replace(tmp_path, path)
+
+
+def write_json_lines(path, records):
+    """Atomically replace path with records written one JSON document per line"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.writelines(dumps(record) + b'\n' for record in records)
+    os.replace(tmp_path, path)
+
+
+def append_json_line(path, record):
+    """Append a single record to a JSON Lines file"""
+    with open(path, 'ab') as f:
+        f.write(dumps(record) + b'\n')
+
+
+def read_json_lines(path):
+    """
+    Read all records from a JSON Lines file, oldest first.
+
+    Lines that fail to parse (e.g. a partial line left by a crash during an
+    append) are skipped.
+    """
+    records = []
+    with open(path, 'rb') as f:
+        if os.path.getsize(path) > MMAP_THRESHOLD:
+            # Map large files instead of copying them through the read buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _parse_json_lines(iter(mm.readline, b''), records)
+        else:
+            _parse_json_lines(f, records)
+    return records
+
+
+def _parse_json_lines(lines, records):
+    """Parse each non-blank line into records, skipping malformed lines"""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(loads(line))
+        except ValueError:
+            continue
+
+
+class BackgroundWriter:
+    """
+    Writes JSON snapshots to disk on a dedicated worker thread.
+
+    Callers queue a snapshot of their data and return immediately; the worker
+    performs serialization and file I/O in the order requests were queued.
+    Once closed, further writes happen synchronously on the caller's thread.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='spidy-writer', daemon=True)
+        self._thread.start()
+
+    def write_json(self, path, data):
+        """Queue data to be written to path as JSON"""
+        self._submit(write_json, path, data)
+
+    def write_json_lines(self, path, records):
+        """Queue records to replace the contents of a JSON Lines file"""
+        self._submit(write_json_lines, path, records)
+
+    def append_json_line(self, path, record):
+        """Queue a single record to be appended to a JSON Lines file"""
+        self._submit(append_json_line, path, record)
+
+    def _submit(self, func, path, data):
+        """Run func(path, data) on the worker thread, or inline once closed"""
+        if self._thread.is_alive():
+            self._queue.put((func, path, data))
+        else:
+            func(path, data)
+
+    def close(self):
+        """Write out any queued snapshots and stop the worker thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        """Worker loop: write queued snapshots until the stop sentinel arrives"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            func, path, data = item
+            try:
+                func(path, data)
+            except Exception as e:
+                print(f"Error writing {path}: {e}")
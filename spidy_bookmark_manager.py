@@ -13,6 +13,31 @@ from PyQt6.QtWidgets import (
     QMessageBox, QDialog, QLabel, QLineEdit, QDialogButtonBox, QStatusBar
 )
 
+# Inline copy of persistence.dumps/loads (orjson if installed): this file is installed standalone
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data):
+    """Serialize data to compact UTF-8 encoded JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Location of the browser's bookmarks file, resolved once per process
+BOOKMARKS_FILE = os.path.join(os.path.expanduser('~'), '.spidy', 'bookmarks.json')
+
 class EditBookmarkDialog(QDialog):
     """Dialog for editing bookmark details"""
     def __init__(self, bookmark, parent=None):
@@ -58,10 +83,10 @@ class BookmarkManager(QMainWindow):
         self.setWindowTitle("Spidy Bookmark Manager")
         self.resize(800, 600)
         
-        # Get path to bookmarks file
-        spidy_config_dir = os.path.join(os.path.expanduser('~'), '.spidy')
-        self.bookmarks_file = os.path.join(spidy_config_dir, 'bookmarks.json')
+        self.bookmarks_file = BOOKMARKS_FILE
         self.bookmarks = []
+        # Bytes last read from or written to bookmarks_file, used to skip no-op saves
+        self._saved_data = None
         
         # Setup UI
         central_widget = QWidget()
@@ -72,8 +97,7 @@ class BookmarkManager(QMainWindow):
         self.table = QTableWidget()
         self.table.setColumnCount(2)
         self.table.setHorizontalHeaderLabels(["Title", "URL"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         layout.addWidget(self.table)
         
@@ -116,26 +140,43 @@ class BookmarkManager(QMainWindow):
     def load_bookmarks(self):
         """Load bookmarks from file"""
         try:
-            if os.path.exists(self.bookmarks_file):
-                with open(self.bookmarks_file, 'r') as f:
-                    self.bookmarks = json.load(f)
-                self.update_table()
-                self.status_bar.showMessage(f"Loaded {len(self.bookmarks)} bookmarks", 3000)
-            else:
-                self.status_bar.showMessage("Bookmark file not found", 3000)
+            # Read the whole file in one call and parse it in memory
+            with open(self.bookmarks_file, 'rb') as f:
+                data = f.read()
+            self.bookmarks = loads(data)
+            self._saved_data = data
+            self.update_table()
+            self.status_bar.showMessage(f"Loaded {len(self.bookmarks)} bookmarks", 3000)
+        except FileNotFoundError:
+            self.status_bar.showMessage("Bookmark file not found", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load bookmarks: {e}")
     
     def update_table(self):
         """Update the table with current bookmarks"""
-        self.table.setRowCount(len(self.bookmarks))
-        for i, bookmark in enumerate(self.bookmarks):
-            self.table.setItem(i, 0, QTableWidgetItem(bookmark.get('title', '')))
-            self.table.setItem(i, 1, QTableWidgetItem(bookmark.get('url', '')))
+        # Suspend repaints and item signals so the table is laid out once, not once per item
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(0)
+            self.table.setRowCount(len(self.bookmarks))
+            for i, bookmark in enumerate(self.bookmarks):
+                self.table.setItem(i, 0, QTableWidgetItem(bookmark.get('title', '')))
+                self.table.setItem(i, 1, QTableWidgetItem(bookmark.get('url', '')))
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+    
+    def update_row(self, row):
+        """Refresh the cells of a single row from its bookmark"""
+        bookmark = self.bookmarks[row]
+        self.table.item(row, 0).setText(bookmark.get('title', ''))
+        self.table.item(row, 1).setText(bookmark.get('url', ''))
     
     def get_selected_row(self):
         """Get the currently selected row index"""
-        selected = self.table.selectedItems()
+        # One index per selected row rather than one item per selected cell
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             return -1
         return selected[0].row()
@@ -144,16 +185,20 @@ class BookmarkManager(QMainWindow):
         """Add a new bookmark"""
         new_bookmark = {
             'title': '',
-            'url': '',
-            'added': datetime.now().isoformat()
+            'url': ''
         }
         
         dialog = EditBookmarkDialog(new_bookmark, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             bookmark = dialog.get_bookmark()
             if bookmark['title'] and bookmark['url']:
+                # Timestamp only bookmarks that are actually added
+                bookmark['added'] = datetime.now().isoformat()
                 self.bookmarks.append(bookmark)
-                self.update_table()
+                row = self.table.rowCount()
+                self.table.insertRow(row)
+                self.table.setItem(row, 0, QTableWidgetItem(bookmark.get('title', '')))
+                self.table.setItem(row, 1, QTableWidgetItem(bookmark.get('url', '')))
                 self.status_bar.showMessage("Bookmark added", 3000)
             else:
                 QMessageBox.warning(self, "Error", "Title and URL cannot be empty")
@@ -168,7 +213,7 @@ class BookmarkManager(QMainWindow):
         dialog = EditBookmarkDialog(self.bookmarks[row], self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.bookmarks[row] = dialog.get_bookmark()
-            self.update_table()
+            self.update_row(row)
             self.status_bar.showMessage("Bookmark updated", 3000)
     
     def delete_bookmark(self):
@@ -185,7 +230,7 @@ class BookmarkManager(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             del self.bookmarks[row]
-            self.update_table()
+            self.table.removeRow(row)
             self.status_bar.showMessage("Bookmark deleted", 3000)
     
     def move_up(self):
@@ -195,7 +240,9 @@ class BookmarkManager(QMainWindow):
             return
             
         self.bookmarks[row], self.bookmarks[row-1] = self.bookmarks[row-1], self.bookmarks[row]
-        self.update_table()
+        # Only the two swapped rows change
+        self.update_row(row)
+        self.update_row(row-1)
         self.table.selectRow(row-1)
         self.status_bar.showMessage("Bookmark moved up", 3000)
     
@@ -206,15 +253,27 @@ class BookmarkManager(QMainWindow):
             return
             
         self.bookmarks[row], self.bookmarks[row+1] = self.bookmarks[row+1], self.bookmarks[row]
-        self.update_table()
+        # Only the two swapped rows change
+        self.update_row(row)
+        self.update_row(row+1)
         self.table.selectRow(row+1)
         self.status_bar.showMessage("Bookmark moved down", 3000)
     
     def save_bookmarks(self):
         """Save bookmarks to file"""
         try:
-            with open(self.bookmarks_file, 'w') as f:
-                json.dump(self.bookmarks, f, indent=2)
+            # Serialize up front so the file is written in a single call
+            data = dumps(self.bookmarks)
+            if data == self._saved_data:
+                self.status_bar.showMessage("No changes to save", 3000)
+                return
+            # Write to a temporary file and rename it over the original so a
+            # failed save never leaves a truncated bookmarks file behind
+            tmp_file = self.bookmarks_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.bookmarks_file)
+            self._saved_data = data
             self.status_bar.showMessage("Bookmarks saved successfully", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save bookmarks: {e}")
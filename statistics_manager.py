@@ -4,10 +4,39 @@ Statistics Manager for Spidy Web Browser
 Handles collection and display of webpage statistics.
 """
 
-from PyQt6.QtCore import QDateTime
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QGridLayout
+from PyQt6.QtCore import Qt, QDateTime
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QDialogButtonBox, QFormLayout
 
 class StatisticsManager:
+    # JavaScript to collect page statistics
+    STATS_JS = """
+    (function() {
+        // Prefer the size reported by the Navigation Timing API; serializing
+        // the whole DOM is only a fallback when it has nothing to report
+        var nav = performance.getEntriesByType && performance.getEntriesByType('navigation')[0];
+        var pageSize = (nav && (nav.transferSize || nav.encodedBodySize)) ||
+                       document.documentElement.outerHTML.length;
+        // Count every element of interest in a single document traversal
+        var counts = {a: 0, img: 0, script: 0, link: 0, meta: 0};
+        var nodes = document.querySelectorAll('a, img, script, link[rel~="stylesheet" i], meta');
+        for (var i = 0; i < nodes.length; i++) {
+            counts[nodes[i].localName]++;
+        }
+        return {
+            title: document.title || '',
+            url: window.location.href || '',
+            domain: window.location.hostname || '',
+            protocol: window.location.protocol || '',
+            pageSize: pageSize,
+            numLinks: counts.a,
+            numImages: counts.img,
+            numScripts: counts.script,
+            numStylesheets: counts.link,
+            metaTags: counts.meta
+        };
+    })();
+    """
+
     def __init__(self, browser):
         self.browser = browser
 
@@ -41,34 +70,30 @@ class StatisticsManager:
             })
             return
 
-        # JavaScript to collect page statistics
-        js_code = """
-        (function() {
-            return {
-                title: document.title || '',
-                url: window.location.href || '',
-                domain: window.location.hostname || '',
-                protocol: window.location.protocol || '',
-                pageSize: document.documentElement.outerHTML.length,
-                numLinks: document.getElementsByTagName('a').length,
-                numImages: document.getElementsByTagName('img').length,
-                numScripts: document.getElementsByTagName('script').length,
-                numStylesheets: document.getElementsByTagName('link').length,
-                metaTags: document.getElementsByTagName('meta').length
-            };
-        })();
-        """
-
-        current_view.page().runJavaScript(js_code, callback)
+        def handle_result(stats):
+            # The script returns title and URL itself; only read them from the
+            # view when it produced nothing (e.g. JavaScript is unavailable)
+            if not stats:
+                url = current_view.url()
+                stats = {
+                    'title': current_view.title(),
+                    'url': url.toString(),
+                    'domain': url.host(),
+                    'protocol': f"{url.scheme()}:"
+                }
+            callback(stats)
+
+        current_view.page().runJavaScript(self.STATS_JS, handle_result)
 
     def create_statistics_dialog(self, stats):
         """Create a dialog displaying the webpage statistics"""
         dialog = QDialog(self.browser)
+        # Free the dialog and its child widgets once it is closed
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         dialog.setWindowTitle("Page Statistics")
         dialog.resize(400, 300)
 
-        layout = QGridLayout()
-        row = 0
+        layout = QFormLayout()
 
         # Add statistics to grid layout
         stats_items = [
@@ -86,14 +111,12 @@ class StatisticsManager:
         ]
 
         for label, value in stats_items:
-            layout.addWidget(QLabel(f"<b>{label}:</b>"), row, 0)
-            layout.addWidget(QLabel(str(value)), row, 1)
-            row += 1
+            layout.addRow(f"<b>{label}:</b>", QLabel(str(value)))
 
         # Add close button
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box, row, 0, 1, 2)
+        layout.addRow(button_box)
 
         dialog.setLayout(layout)
         return dialog
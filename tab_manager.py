@@ -1,11 +1,13 @@
  ### --- UPDATED: tab_manager.py ---
 import os
 from PyQt6.QtCore import Qt, QUrl, QSize
-from PyQt6.QtWebEngineCore import QWebEngineSettings
 from PyQt6.QtWidgets import QTabWidget, QPushButton
 from link_handler import LinkHandler
 from web_view import WebEngineView
 
+# Longest URL scheme add_new_tab looks for before "://" (e.g. "spidy-md")
+MAX_SCHEME_LENGTH = 32
+
 class TabManager:
     def __init__(self, browser):
         self.browser = browser
@@ -31,13 +33,13 @@ class TabManager:
         if qurl is None or isinstance(qurl, bool):
             qurl = QUrl('https://search.brave.com/')
         elif isinstance(qurl, str):
-            if not qurl.startswith(('http://', 'https://', 'file://')):
-                if os.path.exists(qurl):
-                    qurl = QUrl.fromLocalFile(os.path.abspath(qurl))
-                else:
-                    qurl = QUrl('http://' + qurl)
-            else:
+            # A scheme separator near the start means a URL; no need to stat the filesystem
+            if qurl.find('://', 0, MAX_SCHEME_LENGTH + 3) > 0:
                 qurl = QUrl(qurl)
+            elif os.path.exists(os.path.expanduser(qurl)):
+                qurl = QUrl.fromLocalFile(os.path.abspath(os.path.expanduser(qurl)))
+            else:
+                qurl = QUrl('http://' + qurl)
 
         browser = WebEngineView(self.browser)
         page = LinkHandler(browser)
@@ -70,27 +72,20 @@ class TabManager:
             page.open_url_in_new_tab.connect(self.open_url_in_new_tab)
             page.link_clicked_new_tab.connect(self.open_link_in_new_tab)
 
-        settings = browser.settings()
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowWindowActivationFromJavaScript, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-
+        # Web settings are inherited from the default profile (see Browser.configure_web_settings)
         browser.urlChanged.connect(lambda url, b=browser: self.browser.navigation_manager.update_url_field(url))
         browser.titleChanged.connect(lambda title, b=browser: self.update_tab_title(b))
         browser.loadFinished.connect(lambda ok: self.browser.navigation_manager.add_to_history(ok, browser))
         browser.titleChanged.connect(lambda title, b=browser: self.browser.navigation_manager.update_history_title(title, b))
-        browser.loadFinished.connect(lambda: self.browser.navigation_manager.update_navigation_buttons())
-        browser.urlChanged.connect(lambda: self.browser.navigation_manager.update_navigation_buttons())
+        browser.urlChanged.connect(lambda url, b=browser: self.browser.navigation_manager.refresh_navigation_state(b))
+        # urlChanged can fire before the history entry is committed; refresh again once loaded
+        browser.loadFinished.connect(lambda ok, b=browser: self.browser.navigation_manager.refresh_navigation_state(b))
 
     def close_tab(self, index):
         if self.tab_widget.count() > 1:
             self.tab_widget.removeTab(index)
             browser = self.tabs.pop(index)
+            self.browser.navigation_manager.discard_navigation_state(browser)
             browser.deleteLater()
 
     def close_current_tab(self):
@@ -123,5 +118,7 @@ class TabManager:
         index = self.tab_widget.indexOf(browser)
         if index != -1:
             title = browser.page().title()
-            self.tab_widget.setTabText(index, title[:20] + '...' if len(title) > 20 else title)
+            if len(title) > 20:
+                title = title[:20] + '...'
+            self.tab_widget.setTabText(index, title)
 
@@ -8,8 +8,8 @@ and calls the show_about method to verify it works correctly.
 import sys
 import os
 import subprocess
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 
 # Import the Browser class from the current directory
 from browser import Browser
@@ -48,7 +48,7 @@ def main():
         print("Opening About dialog. It will close automatically in 5 seconds...")
         
         # Start the Qt event loop
-        sys.exit(app.exec_())
+        sys.exit(app.exec())
         
     except Exception as e:
         print(f"Error: {e}")
@@ -2,8 +2,8 @@ import unittest
 from unittest.mock import MagicMock, patch
 import os
 import json
-from PyQt5.QtCore import QUrl
-from PyQt5.QtWidgets import QMessageBox
+from PyQt6.QtCore import QUrl
+from PyQt6.QtWidgets import QMessageBox
 from bookmark_manager import BookmarkManager
 
 class TestBookmarkManager(unittest.TestCase):
@@ -17,19 +17,22 @@ class TestBookmarkManager(unittest.TestCase):
     def test_load_bookmarks(self):
         """Test bookmarks loading functionality"""
         test_bookmarks = [{"url": "https://example.com", "title": "Example"}]
-        mock_open = unittest.mock.mock_open(read_data=json.dumps(test_bookmarks))
+        data = json.dumps(test_bookmarks)
+        mock_open = unittest.mock.mock_open(read_data=data)
         with patch('builtins.open', mock_open):
-            with patch('os.path.exists', return_value=True):
+            with patch('os.path.getsize', return_value=len(data)):
                 self.bookmark_manager.load_bookmarks()
                 self.assertEqual(len(self.bookmark_manager.bookmarks), 1)
 
     def test_save_bookmarks(self):
         """Test bookmarks saving functionality"""
-        with patch('builtins.open', unittest.mock.mock_open()) as mock_file:
-            with patch('os.path.exists', return_value=True):
-                self.bookmark_manager.bookmarks = [{"url": "https://example.com"}]
-                self.bookmark_manager.save_bookmarks()
-                mock_file.assert_called_once()
+        writer = self.browser_mock.writer
+        self.bookmark_manager.bookmarks = [{"url": "https://example.com"}]
+        self.bookmark_manager.save_bookmarks()
+        writer.write_json.assert_not_called()
+        self.bookmark_manager.flush_bookmarks()
+        writer.write_json.assert_called_once_with(
+            self.bookmark_manager.bookmarks_file, [{"url": "https://example.com"}])
 
     def test_add_bookmark(self):
         """Test adding a bookmark"""
@@ -43,7 +46,7 @@ class TestBookmarkManager(unittest.TestCase):
         # Mock file operations
         with patch('builtins.open', unittest.mock.mock_open()):
             with patch('os.path.exists', return_value=True):
-                with patch('PyQt5.QtWidgets.QMessageBox.information') as mock_info:
+                with patch.object(self.bookmark_manager, '_info') as mock_info:
                     self.bookmark_manager.add_bookmark()
                     self.assertEqual(len(self.bookmark_manager.bookmarks), 1)
                     self.assertEqual(self.bookmark_manager.bookmarks[0]["url"], "https://example.com")
@@ -61,16 +64,34 @@ class TestBookmarkManager(unittest.TestCase):
         # Create mock index with row method
         mock_index = MagicMock()
         mock_index.row = lambda: 0
-        mock_table.selectedIndexes.return_value = [mock_index]
+        mock_table.selectionModel().selectedRows.return_value = [mock_index]
         
         # Mock file operations and dialog
         with patch('builtins.open', unittest.mock.mock_open()):
             with patch('os.path.exists', return_value=True):
-                with patch('PyQt5.QtWidgets.QMessageBox.question') as mock_question:
-                    with patch('PyQt5.QtWidgets.QMessageBox.information'):
-                        mock_question.return_value = QMessageBox.Yes
+                with patch('PyQt6.QtWidgets.QMessageBox.question') as mock_question:
+                    with patch.object(self.bookmark_manager, '_info'):
+                        mock_question.return_value = QMessageBox.StandardButton.Yes
                         self.bookmark_manager.remove_bookmark(mock_table)
                         self.assertEqual(len(self.bookmark_manager.bookmarks), 0)
+                        mock_table.model().endRemoveRows.assert_called_once()
+
+    def test_view_bookmarks_reuses_dialog(self):
+        """Test that the bookmarks dialog is built once and refreshed when stale"""
+        mock_dialog = MagicMock()
+        with patch.object(self.bookmark_manager, 'create_bookmarks_dialog',
+                          return_value=mock_dialog) as mock_create:
+            self.bookmark_manager.view_bookmarks()
+            mock_model = self.bookmark_manager._bookmarks_model = MagicMock()
+            self.bookmark_manager.view_bookmarks()
+            mock_model.refresh.assert_not_called()
+
+            self.bookmark_manager._bookmarks_table_stale = True
+            self.bookmark_manager.view_bookmarks()
+            mock_model.refresh.assert_called_once()
+
+        mock_create.assert_called_once()
+        self.assertEqual(mock_dialog.exec.call_count, 3)
 
     def test_clear_bookmarks(self):
         """Test clearing all bookmarks"""
@@ -83,8 +104,8 @@ class TestBookmarkManager(unittest.TestCase):
         # Mock file operations and dialog
         with patch('builtins.open', unittest.mock.mock_open()):
             with patch('os.path.exists', return_value=True):
-                with patch('PyQt5.QtWidgets.QMessageBox.question') as mock_question:
-                    with patch('PyQt5.QtWidgets.QMessageBox.information'):
-                        mock_question.return_value = QMessageBox.Yes
+                with patch('PyQt6.QtWidgets.QMessageBox.question') as mock_question:
+                    with patch.object(self.bookmark_manager, '_info'):
+                        mock_question.return_value = QMessageBox.StandardButton.Yes
                         self.bookmark_manager.clear_bookmarks()
                         self.assertEqual(len(self.bookmark_manager.bookmarks), 0)
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtWidgets import QApplication
 import sys
 from browser import Browser
 
@@ -17,24 +17,22 @@ class TestBrowser(unittest.TestCase):
         if _app is None:
             _app = QApplication(sys.argv)
         
-        # Mock QtWebEngine initialization
-        with patch('PyQt5.QtWebEngine.QtWebEngine.initialize'):
-            cls.qtwebengine_patch = patch('PyQt5.QtWebEngineWidgets.QWebEngineView')
-            cls.qtwebengine_mock = cls.qtwebengine_patch.start()
+        # Mock the web engine view
+        cls.qtwebengine_patch = patch('PyQt6.QtWebEngineWidgets.QWebEngineView')
+        cls.qtwebengine_mock = cls.qtwebengine_patch.start()
 
     def setUp(self):
         """Set up test browser instance"""
         # Mock necessary components
-        with patch('PyQt5.QtWebEngineWidgets.QWebEngineSettings'):
+        with patch('PyQt6.QtWebEngineCore.QWebEngineSettings'):
             with patch('os.makedirs'):
-                with patch('PyQt5.QtWebEngine.QtWebEngine.initialize'):
-                    self.browser = Browser()
-                    
-                    # Mock managers
-                    self.browser.tab_manager = MagicMock()
-                    self.browser.navigation_manager = MagicMock()
-                    self.browser.bookmark_manager = MagicMock()
-                    self.browser.statistics_manager = MagicMock()
+                self.browser = Browser()
+                
+                # Mock managers
+                self.browser.tab_manager = MagicMock()
+                self.browser.navigation_manager = MagicMock()
+                self.browser.bookmark_manager = MagicMock()
+                self.browser.statistics_manager = MagicMock()
 
     @classmethod
     def tearDownClass(cls):
@@ -45,7 +43,7 @@ class TestBrowser(unittest.TestCase):
         """Test keyboard navigation handling"""
         # Mock key press event
         event = MagicMock()
-        event.key = MagicMock(return_value=Qt.Key_Left)
+        event.key = MagicMock(return_value=Qt.Key.Key_Left)
         
         # Mock current view
         mock_view = MagicMock()
@@ -58,7 +56,7 @@ class TestBrowser(unittest.TestCase):
         self.browser.tab_manager.current_view.return_value = mock_view
         
         self.browser.keyPressEvent(event)
-        self.browser.navigation_manager.view_back.assert_called_once()
+        mock_view.back.assert_called_once()
 
     def test_save_page(self):
         """Test page saving functionality"""
@@ -69,15 +67,15 @@ class TestBrowser(unittest.TestCase):
         
         self.browser.tab_manager.current_view.return_value = mock_view
         
-        with patch('PyQt5.QtWidgets.QFileDialog.getSaveFileName') as mock_dialog:
-            with patch('PyQt5.QtWidgets.QMessageBox.information'):
+        with patch('PyQt6.QtWidgets.QFileDialog.getSaveFileName') as mock_dialog:
+            with patch('PyQt6.QtWidgets.QMessageBox.information'):
                 mock_dialog.return_value = ("/tmp/test.html", "")
                 self.browser.save_page()
                 mock_page.save.assert_called_once_with("/tmp/test.html")
 
     def test_open_file(self):
         """Test file opening functionality"""
-        with patch('PyQt5.QtWidgets.QFileDialog.getOpenFileName') as mock_dialog:
+        with patch('PyQt6.QtWidgets.QFileDialog.getOpenFileName') as mock_dialog:
             mock_dialog.return_value = ("/tmp/test.html", "")
             self.browser.open_file()
             self.browser.tab_manager.add_new_tab.assert_called_once()
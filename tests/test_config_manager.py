@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import patch
+import configparser
+import os
+import tempfile
+from config_manager import ConfigManager, parse_ini
+
+class TestConfigManager(unittest.TestCase):
+    def setUp(self):
+        """Set up a config manager over a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with patch('sys.argv', ['spidy']):
+            self.config = ConfigManager(self.temp_dir.name)
+
+    def tearDown(self):
+        """Remove temporary files"""
+        self.temp_dir.cleanup()
+
+    def test_parse_ini(self):
+        """Test parsing sections and options, skipping comments and blank lines"""
+        text = ("[General]\n"
+                "; a comment\n"
+                "Home_Page = https://example.com/?q=a:b\n"
+                "\n"
+                "cache_dir =\n"
+                "[Rendering]\n"
+                "webgl_enabled: True\n")
+        self.assertEqual(parse_ini(text), {
+            "General": {"home_page": "https://example.com/?q=a:b", "cache_dir": ""},
+            "Rendering": {"webgl_enabled": "True"}
+        })
+
+    def assertParsesLikeConfigParser(self, text):
+        """Assert that parse_ini reads text the same way configparser does"""
+        parser = configparser.ConfigParser(interpolation=None)
+        try:
+            parser.read_string(text)
+        except configparser.ParsingError:
+            pass  # configparser keeps the valid options and reports bad lines at the end
+        expected = {section: dict(parser[section]) for section in parser.sections()}
+        self.assertEqual(parse_ini(text), expected)
+
+    def test_parse_continuation_lines(self):
+        """Test that indented lines continue the previous value"""
+        self.assertParsesLikeConfigParser("[General]\nmulti = line1\n  line2\nnext = value\n")
+        self.assertParsesLikeConfigParser("[General]\nmulti =\n  line1\n\n  line2\n\n")
+
+    def test_parse_section_header_with_trailing_text(self):
+        """Test that text after a section header's closing bracket is ignored"""
+        self.assertParsesLikeConfigParser("[General] ; x\nhome_page = a\n[Rendering]\nwebgl_enabled = True\n")
+
+    def test_parse_indented_options(self):
+        """Test that indented lines with no value to continue are options"""
+        self.assertParsesLikeConfigParser("[General]\n  home_page = x\n  default_zoom = 150\n")
+
+    def test_parse_comment_inside_continuation(self):
+        """Test that a comment line between a value and its continuation is skipped"""
+        self.assertParsesLikeConfigParser("[General]\nmulti = a\n; comment\n  b\n")
+
+    def test_parse_skips_invalid_lines(self):
+        """Test that invalid lines are reported while the valid options are kept"""
+        text = ("[General]\nhome_page = https://mine.example/\nbogus line\n"
+                "[Rendering]\ndefault_zoom=150\n")
+        self.assertParsesLikeConfigParser(text)
+        errors = []
+        parse_ini("stray = a\n" + text, errors)
+        self.assertEqual(len(errors), 2)
+
+    def test_parse_reports_duplicates(self):
+        """Test that repeated sections and options are merged, later values winning, and reported"""
+        errors = []
+        text = "[General]\nhome_page = a\nhome_page = b\n[General]\ncache_dir = c\n"
+        self.assertEqual(parse_ini(text, errors), {"General": {"home_page": "b", "cache_dir": "c"}})
+        self.assertEqual(len(errors), 2)
+
+    def test_load_keeps_valid_options(self):
+        """Test that one bad line does not discard the rest of config.ini"""
+        with open(os.path.join(self.temp_dir.name, 'config.ini'), 'w') as f:
+            f.write("[General]\nhome_page = https://mine.example/\nbogus line\n"
+                    "[Rendering]\ndefault_zoom=150\n")
+        with patch('sys.argv', ['spidy']):
+            config = ConfigManager(self.temp_dir.name)
+        self.assertEqual(config.get("General", "home_page"), "https://mine.example/")
+        self.assertEqual(config.get_int("Rendering", "default_zoom"), 150)
+
+    def test_defaults(self):
+        """Test typed getters over the default configuration"""
+        self.assertEqual(self.config.get("General", "home_page"), "https://search.brave.com/")
+        self.assertTrue(self.config.get_boolean("Browser", "javascript_enabled"))
+        self.assertEqual(self.config.get_int("Rendering", "default_zoom"), 100)
+        self.assertEqual(self.config.get("Missing", "option", "fallback"), "fallback")
+        self.assertEqual(self.config.get_int("Network", "proxy_port", 8080), 8080)
+
+    def test_option_names_are_case_insensitive(self):
+        """Test that mixed-case option names reach the same lowercased option"""
+        self.config.set("General", "Home_Page", "https://example.com/")
+        self.assertEqual(self.config.get("General", "home_page"), "https://example.com/")
+        self.assertEqual(self.config.get("General", "HOME_PAGE"), "https://example.com/")
+        self.config.set("Rendering", "Default_Zoom", 150)
+        self.assertEqual(self.config.get_int("Rendering", "DEFAULT_ZOOM"), 150)
+        self.assertFalse(self.config.get_boolean("Rendering", "WebGL_Enabled", True))
+
+        with patch('sys.argv', ['spidy', '--general.Home_Page=https://test.com/']):
+            config = ConfigManager(self.temp_dir.name)
+        self.assertEqual(config.get("General", "home_page"), "https://test.com/")
+
+    def test_save_and_load(self):
+        """Test that saved values are read back by a new manager"""
+        self.config.set("General", "home_page", "https://example.com/")
+        self.config.set("Rendering", "webgl_enabled", True)
+        self.config.save_config()
+
+        with patch('sys.argv', ['spidy']):
+            config = ConfigManager(self.temp_dir.name)
+        self.assertEqual(config.get("General", "home_page"), "https://example.com/")
+        self.assertTrue(config.get_boolean("Rendering", "webgl_enabled"))
+        self.assertEqual(config.get("Privacy", "do_not_track"), "True")
+
+if __name__ == '__main__':
+    unittest.main()
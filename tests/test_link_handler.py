@@ -1,8 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch, create_autospec
 from datetime import datetime
-from PyQt5.QtCore import QUrl, QObject
-from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
+from PyQt6.QtCore import QUrl, QObject
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
 from link_handler import LinkHandler
 
 class TestLinkHandler(unittest.TestCase):
@@ -101,7 +101,7 @@ class TestLinkHandler(unittest.TestCase):
         url = QUrl("http://example.com")
         result = self.link_handler.acceptNavigationRequest(
             url, 
-            QWebEnginePage.NavigationTypeLinkClicked,
+            QWebEnginePage.NavigationType.NavigationTypeLinkClicked,
             True
         )
         self.assertTrue(result)
@@ -110,7 +110,7 @@ class TestLinkHandler(unittest.TestCase):
         self.assertEqual(len(self.link_handler.nav_history), 1)
         entry = self.link_handler.nav_history[0]
         self.assertEqual(entry["url"], url.toString())
-        self.assertEqual(entry["type"], QWebEnginePage.NavigationTypeLinkClicked)
+        self.assertEqual(entry["type"], QWebEnginePage.NavigationType.NavigationTypeLinkClicked)
         self.assertTrue(entry["success"])
 
     def test_navigation_request_file(self):
@@ -122,7 +122,7 @@ class TestLinkHandler(unittest.TestCase):
             url = QUrl.fromLocalFile("/path/to/file.html")
             result = self.link_handler.acceptNavigationRequest(
                 url,
-                QWebEnginePage.NavigationTypeLinkClicked,
+                QWebEnginePage.NavigationType.NavigationTypeLinkClicked,
                 True
             )
             self.assertTrue(result)
@@ -137,7 +137,7 @@ class TestLinkHandler(unittest.TestCase):
         url = QUrl("custom://example.com")
         result = self.link_handler.acceptNavigationRequest(
             url,
-            QWebEnginePage.NavigationTypeLinkClicked,
+            QWebEnginePage.NavigationType.NavigationTypeLinkClicked,
             False
         )
         # Should allow with warning for unknown schemes
@@ -153,14 +153,14 @@ class TestLinkHandler(unittest.TestCase):
         url1 = QUrl("https://example.com")
         self.link_handler.acceptNavigationRequest(
             url1,
-            QWebEnginePage.NavigationTypeLinkClicked,
+            QWebEnginePage.NavigationType.NavigationTypeLinkClicked,
             True
         )
         
         url2 = QUrl("javascript:alert('test')")
         self.link_handler.acceptNavigationRequest(
             url2,
-            QWebEnginePage.NavigationTypeLinkClicked,
+            QWebEnginePage.NavigationType.NavigationTypeLinkClicked,
             False
         )
         
@@ -202,7 +202,7 @@ class TestLinkHandler(unittest.TestCase):
         # Test form submission
         self.link_handler.acceptNavigationRequest(
             url,
-            QWebEnginePage.NavigationTypeFormSubmitted,
+            QWebEnginePage.NavigationType.NavigationTypeFormSubmitted,
             True
         )
         self.assertEqual(
@@ -213,7 +213,7 @@ class TestLinkHandler(unittest.TestCase):
         # Test back/forward navigation
         self.link_handler.acceptNavigationRequest(
             url,
-            QWebEnginePage.NavigationTypeBackForward,
+            QWebEnginePage.NavigationType.NavigationTypeBackForward,
             True
         )
         self.assertEqual(
@@ -224,7 +224,7 @@ class TestLinkHandler(unittest.TestCase):
         # Test reload
         self.link_handler.acceptNavigationRequest(
             url,
-            QWebEnginePage.NavigationTypeReload,
+            QWebEnginePage.NavigationType.NavigationTypeReload,
             True
         )
         self.assertEqual(
@@ -8,8 +8,8 @@ without going through the browser interface.
 
 import os
 import sys
-from PyQt5.QtCore import QUrl
-from PyQt5.QtWidgets import QApplication
+from PyQt6.QtCore import QUrl
+from PyQt6.QtWidgets import QApplication
 
 # Import the LinkHandler class from link_handler.py
 from link_handler import LinkHandler
@@ -2,8 +2,8 @@ import unittest
 from unittest.mock import MagicMock, patch
 import json
 import os
-from PyQt5.QtCore import QUrl
-from PyQt5.QtWidgets import QMessageBox
+from PyQt6.QtCore import QUrl
+from PyQt6.QtWidgets import QMessageBox
 from navigation_manager import NavigationManager
 
 class TestNavigationManager(unittest.TestCase):
@@ -13,24 +13,33 @@ class TestNavigationManager(unittest.TestCase):
         # Mock the config directory
         self.browser_mock.config_dir = "/tmp/spidy_test"
         self.nav_manager = NavigationManager(self.browser_mock)
-        self.nav_manager.history_file = os.path.join(self.browser_mock.config_dir, 'history.json')
+        self.nav_manager.history_file = os.path.join(self.browser_mock.config_dir, 'history.jsonl')
 
     def test_load_history(self):
         """Test history loading functionality"""
-        test_history = [{"url": "https://example.com", "title": "Example"}]
-        mock_open = unittest.mock.mock_open(read_data=json.dumps(test_history))
+        test_history = [
+            {"url": "https://example.com", "title": "Example"},
+            {"url": "https://test.com", "title": "Test"}
+        ]
+        data = "".join(json.dumps(entry) + "\n" for entry in test_history)
+        mock_open = unittest.mock.mock_open(read_data=data)
         with patch('builtins.open', mock_open):
-            with patch('os.path.exists', return_value=True):
+            with patch('os.path.exists', return_value=True), \
+                 patch('os.path.getsize', return_value=len(data)):
                 self.nav_manager.load_history()
-                self.assertEqual(len(self.nav_manager.history), 1)
+                self.assertEqual(len(self.nav_manager.history), 2)
+                # Entries are keyed by URL, oldest (first line) first
+                self.assertEqual(list(self.nav_manager.history), ["https://example.com", "https://test.com"])
 
     def test_save_history(self):
         """Test history saving functionality"""
-        with patch('builtins.open', unittest.mock.mock_open()) as mock_file:
-            with patch('os.path.exists', return_value=True):
-                self.nav_manager.history = [{"url": "https://example.com"}]
-                self.nav_manager.save_history()
-                mock_file.assert_called_once()
+        writer = self.browser_mock.writer
+        self.nav_manager._set_history([{"url": "https://example.com"}])
+        self.nav_manager.save_history()
+        writer.write_json_lines.assert_not_called()
+        self.nav_manager.flush_history()
+        writer.write_json_lines.assert_called_once_with(
+            self.nav_manager.history_file, [{"url": "https://example.com"}])
 
     def test_navigate_to_url(self):
         """Test URL navigation"""
@@ -78,23 +87,52 @@ class TestNavigationManager(unittest.TestCase):
             with patch('os.path.exists', return_value=True):
                 self.nav_manager.add_to_history(True)
                 self.assertEqual(len(self.nav_manager.history), 1)
-                self.assertEqual(self.nav_manager.history[0]["url"], "https://example.com")
+                entry = self.nav_manager.history["https://example.com"]
+                self.assertEqual(entry["url"], "https://example.com")
+                self.browser_mock.writer.append_json_line.assert_called_once_with(
+                    self.nav_manager.history_file, entry)
+
+    def test_add_to_history_moves_revisit_to_front(self):
+        """Test that revisiting a URL moves its entry to the newest end"""
+        mock_view = MagicMock()
+        mock_view.title.return_value = "Example"
+        self.browser_mock.tab_manager.current_view.return_value = mock_view
+
+        for url in ("https://example.com", "https://test.com", "https://example.com"):
+            mock_view.url.return_value = QUrl(url)
+            self.nav_manager.add_to_history(True)
+
+        self.assertEqual(list(self.nav_manager.history), ["https://test.com", "https://example.com"])
+        self.assertEqual(self.nav_manager.history["https://example.com"]["visited"], 2)
+
+    def test_history_is_capped(self):
+        """Test that the oldest entry is dropped once the history is full"""
+        self.nav_manager.MAX_HISTORY_ENTRIES = 2
+        mock_view = MagicMock()
+        mock_view.title.return_value = "Example"
+        self.browser_mock.tab_manager.current_view.return_value = mock_view
+
+        for url in ("https://a.com", "https://b.com", "https://c.com"):
+            mock_view.url.return_value = QUrl(url)
+            self.nav_manager.add_to_history(True)
+
+        self.assertEqual(list(self.nav_manager.history), ["https://b.com", "https://c.com"])
 
     def test_clear_history(self):
         """Test history clearing"""
         # Add some test history
-        self.nav_manager.history = [
+        self.nav_manager._set_history([
             {"url": "https://example.com", "title": "Example"},
             {"url": "https://test.com", "title": "Test"}
-        ]
+        ])
         
         # Mock file operations and dialog
         with patch('builtins.open', unittest.mock.mock_open()):
             with patch('os.path.exists', return_value=True):
-                with patch('PyQt5.QtWidgets.QMessageBox.question') as mock_question:
-                    with patch('PyQt5.QtWidgets.QMessageBox.information'):
+                with patch('PyQt6.QtWidgets.QMessageBox.question') as mock_question:
+                    with patch('PyQt6.QtWidgets.QMessageBox.information'):
                         # Set the return value to Yes
-                        mock_question.return_value = QMessageBox.Yes
+                        mock_question.return_value = QMessageBox.StandardButton.Yes
                         
                         # Call clear_history
                         self.nav_manager.clear_history()
@@ -0,0 +1,83 @@
+import unittest
+import json
+import os
+import tempfile
+from persistence import BackgroundWriter, read_json, read_json_lines, MMAP_THRESHOLD
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory and writer"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'data.json')
+        self.writer = BackgroundWriter()
+
+    def tearDown(self):
+        """Stop the writer and remove temporary files"""
+        self.writer.close()
+        self.temp_dir.cleanup()
+
+    def test_write_json(self):
+        """Test that queued snapshots are written once the writer is closed"""
+        self.writer.write_json(self.path, [{"url": "https://example.com"}])
+        self.writer.write_json(self.path, [{"url": "https://test.com"}])
+        self.writer.close()
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), [{"url": "https://test.com"}])
+
+    def test_write_is_atomic(self):
+        """Test that no temporary file is left behind after a write"""
+        self.writer.write_json(self.path, {"title": "Caf\u00e9"})
+        self.writer.close()
+
+        self.assertEqual(os.listdir(self.temp_dir.name), ['data.json'])
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '{"title":"Caf\u00e9"}')
+
+    def test_json_lines(self):
+        """Test appending to and rewriting a JSON Lines file"""
+        self.writer.append_json_line(self.path, {"url": "https://example.com"})
+        self.writer.append_json_line(self.path, {"url": "https://test.com"})
+        self.writer.close()
+        self.assertEqual(read_json_lines(self.path),
+                         [{"url": "https://example.com"}, {"url": "https://test.com"}])
+
+        self.writer.write_json_lines(self.path, [{"url": "https://test.com"}])
+        self.assertEqual(read_json_lines(self.path), [{"url": "https://test.com"}])
+
+    def test_read_json_lines_skips_partial_line(self):
+        """Test that a truncated trailing line is ignored"""
+        with open(self.path, 'w') as f:
+            f.write('{"url": "https://example.com"}\n{"url": "https://te')
+        self.assertEqual(read_json_lines(self.path), [{"url": "https://example.com"}])
+
+    def test_read_large_json_lines(self):
+        """Test reading a JSON Lines file above the mmap threshold"""
+        records = [{"url": f"https://example.com/{i}", "title": "x" * 100} for i in range(3000)]
+        self.writer.write_json_lines(self.path, records)
+        self.writer.close()
+
+        self.assertGreater(os.path.getsize(self.path), MMAP_THRESHOLD)
+        self.assertEqual(read_json_lines(self.path), records)
+
+    def test_read_json(self):
+        """Test reading back small and large JSON documents"""
+        self.writer.write_json(self.path, {"key": "value"})
+        self.writer.close()
+        self.assertEqual(read_json(self.path), {"key": "value"})
+
+        records = [{"url": f"https://example.com/{i}", "title": "x" * 100} for i in range(3000)]
+        self.writer.write_json(self.path, records)
+        self.assertGreater(os.path.getsize(self.path), MMAP_THRESHOLD)
+        self.assertEqual(read_json(self.path), records)
+
+    def test_write_after_close(self):
+        """Test that writes after close happen synchronously"""
+        self.writer.close()
+        self.writer.write_json(self.path, {"key": "value"})
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"key": "value"})
+
+if __name__ == '__main__':
+    unittest.main()
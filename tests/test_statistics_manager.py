@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from PyQt5.QtCore import QUrl
+from PyQt6.QtCore import QUrl
 from statistics_manager import StatisticsManager
 
 class TestStatisticsManager(unittest.TestCase):
@@ -57,3 +57,21 @@ class TestStatisticsManager(unittest.TestCase):
         self.assertEqual(args['pageSize'], 1000)
         self.assertEqual(args['numLinks'], 5)
 
+
+    def test_collect_page_statistics_without_script_result(self):
+        """Test that a None JavaScript result falls back to the view's title and URL"""
+        mock_callback = MagicMock()
+        mock_view = MagicMock()
+        mock_view.title.return_value = 'Test Page'
+        mock_view.url.return_value = QUrl('https://example.com/page')
+        mock_view.page.return_value.runJavaScript = lambda js_code, callback: callback(None)
+        self.browser_mock.tab_manager.current_view.return_value = mock_view
+        
+        self.stats_manager.collect_page_statistics(mock_callback)
+        
+        mock_callback.assert_called_once_with({
+            'title': 'Test Page',
+            'url': 'https://example.com/page',
+            'domain': 'example.com',
+            'protocol': 'https:'
+        })
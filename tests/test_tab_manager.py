@@ -7,11 +7,12 @@ in the Spidy browser.
 
 import unittest
 from unittest.mock import MagicMock, patch, create_autospec
-from PyQt5.QtCore import Qt, QUrl, QSize
-from PyQt5.QtWidgets import QTabWidget, QPushButton, QApplication
-from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+from PyQt6.QtCore import Qt, QUrl, QSize
+from PyQt6.QtWidgets import QTabWidget, QPushButton, QApplication
+from PyQt6.QtWebEngineCore import QWebEngineSettings
 import sys
 import os
+import tempfile
 
 # Create a single QApplication instance for all tests at module level
 # This prevents creating multiple QApplication instances which can cause crashes
@@ -238,6 +239,40 @@ class TestTabManager(unittest.TestCase):
         # Verify wrap-around to last tab (index 2)
         self.tab_widget_mock.setCurrentIndex.assert_called_once_with(2)
         
+    def test_add_new_tab_with_string(self):
+        """
+        Test adding a new tab from a string.
+        
+        Verifies that URLs with long schemes are used as-is, existing relative
+        paths open as local files and anything else is prefixed with http://
+        """
+        with patch('tab_manager.WebEngineView', return_value=self.web_view_mock), \
+             patch('tab_manager.LinkHandler', return_value=self.link_handler_mock), \
+             patch.object(self.tab_manager, '_configure_tab'):
+            self.tab_manager.add_new_tab('spidy-md://docs/readme.md')
+            self.web_view_mock.setUrl.assert_called_with(QUrl('spidy-md://docs/readme.md'))
+            
+            with patch('os.path.exists', return_value=True):
+                self.tab_manager.add_new_tab('docs/page.html')
+            self.web_view_mock.setUrl.assert_called_with(
+                QUrl.fromLocalFile(os.path.abspath('docs/page.html')))
+            
+            with patch('os.path.exists', return_value=False):
+                self.tab_manager.add_new_tab('example.com')
+            self.web_view_mock.setUrl.assert_called_with(QUrl('http://example.com'))
+
+    def test_add_new_tab_with_path_containing_space(self):
+        """Test that an existing local file whose path contains a space opens as a file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'My Docs', 'page.html')
+            os.makedirs(os.path.dirname(path))
+            open(path, 'w').close()
+            with patch('tab_manager.WebEngineView', return_value=self.web_view_mock), \
+                 patch('tab_manager.LinkHandler', return_value=self.link_handler_mock), \
+                 patch.object(self.tab_manager, '_configure_tab'):
+                self.tab_manager.add_new_tab(path)
+            self.web_view_mock.setUrl.assert_called_with(QUrl.fromLocalFile(path))
+
     def test_add_new_tab_with_url(self):
         """
         Test adding a new tab with specific URL.
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import QUrl
+from PyQt6.QtCore import QUrl
 print("Testing URL handling:")
 test_url = "file:///home/juren/Projects/Spidy/webpage.html"
 print(f"Original URL: {test_url}")
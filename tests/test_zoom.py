@@ -13,8 +13,8 @@ import time
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QLabel
-from PyQt5.QtCore import QUrl, Qt
+from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QLabel
+from PyQt6.QtCore import QUrl, Qt
 from web_view import WebEngineView
 
 class ZoomTestWindow(QMainWindow):
@@ -161,7 +161,7 @@ class ZoomTestWindow(QMainWindow):
 
     def wheelEvent(self, event):
         """Display a message when Ctrl+wheel is used"""
-        if event.modifiers() & Qt.ControlModifier:
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
             print("Ctrl+wheel detected in main window (wheel event is handled by the WebEngineView)")
         super().wheelEvent(event)
 
@@ -177,7 +177,7 @@ def main():
     window.show()
     
     # Run the application
-    exit_code = app.exec_()
+    exit_code = app.exec()
     
     # Report results
     print("Zoom test completed")
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import QUrl
+from PyQt6.QtCore import QUrl
 
 def test_url(url_string):
     print(f"\nTesting URL: {url_string}")
@@ -70,21 +70,48 @@ class UIManager:
     def create_menu(self):
         """Create and setup the main menu bar"""
         menu_bar = self.browser.menuBar()
-        
-        # File menu
-        file_menu = menu_bar.addMenu("&File")
-        self.add_file_menu_actions(file_menu)
-        
-        # Bookmarks menu
-        bookmarks_menu = menu_bar.addMenu("&Bookmarks")
-        self.add_bookmark_menu_actions(bookmarks_menu)
-        
-        # History menu
-        history_menu = menu_bar.addMenu("&History")
-        self.add_history_menu_actions(history_menu)
-        
-        # Other menus
-        self.add_additional_menus(menu_bar)
+        for menu_title, entries in self.menu_spec():
+            menu = menu_bar.addMenu(menu_title)
+            for entry in entries:
+                # None marks a separator
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                label, handler = entry
+                action = QAction(label, self.browser)
+                menu.addAction(action)
+                action.triggered.connect(handler)
+
+    def menu_spec(self):
+        """Return the menu bar layout as (menu title, [(action label, handler) or None]) pairs"""
+        browser = self.browser
+        return [
+            ("&File", [
+                ("Open File", browser.open_file),
+                ("Save Page", browser.save_page),
+                None,
+                ("E&xit", browser.close),
+            ]),
+            ("&Bookmarks", [
+                ("Add Bookmark", browser.bookmark_manager.add_bookmark),
+                ("View Bookmarks", browser.bookmark_manager.view_bookmarks),
+                ("Clear Bookmarks", browser.bookmark_manager.clear_bookmarks),
+            ]),
+            ("&History", [
+                ("View History", browser.navigation_manager.view_history),
+                ("Clear History", browser.navigation_manager.clear_history),
+            ]),
+            ("&Statistics", [
+                ("View Statistics", browser.view_statistics),
+            ]),
+            ("Hel&p", [
+                ("Help Contents", browser.show_help),
+            ]),
+            ("&About", [
+                ("About Spidy", browser.show_about),
+                ("Release History", browser.show_release_history),
+            ]),
+        ]
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -92,67 +119,3 @@ class UIManager:
         QShortcut(QKeySequence("Ctrl+W"), self.browser, self.browser.tab_manager.close_current_tab)
         QShortcut(QKeySequence("Ctrl+Tab"), self.browser, self.browser.tab_manager.next_tab)
         QShortcut(QKeySequence("Ctrl+Shift+Tab"), self.browser, self.browser.tab_manager.previous_tab)
-
-    def add_file_menu_actions(self, menu):
-        """Add actions to File menu"""
-        open_file_action = QAction("Open File", self.browser)
-        menu.addAction(open_file_action)
-        open_file_action.triggered.connect(self.browser.open_file)
-        
-        save_page_action = QAction('Save Page', self.browser)
-        menu.addAction(save_page_action)
-        save_page_action.triggered.connect(self.browser.save_page)
-        
-        menu.addSeparator()
-        exit_action = QAction("E&xit", self.browser)
-        menu.addAction(exit_action)
-        exit_action.triggered.connect(self.browser.close)
-
-    def add_bookmark_menu_actions(self, menu):
-        """Add actions to Bookmarks menu"""
-        add_bookmark_action = QAction("Add Bookmark", self.browser)
-        view_bookmarks_action = QAction("View Bookmarks", self.browser)
-        clear_bookmarks_action = QAction("Clear Bookmarks", self.browser)
-        
-        menu.addAction(add_bookmark_action)
-        menu.addAction(view_bookmarks_action)
-        menu.addAction(clear_bookmarks_action)
-        
-        add_bookmark_action.triggered.connect(self.browser.bookmark_manager.add_bookmark)
-        view_bookmarks_action.triggered.connect(self.browser.bookmark_manager.view_bookmarks)
-        clear_bookmarks_action.triggered.connect(self.browser.bookmark_manager.clear_bookmarks)
-
-    def add_history_menu_actions(self, menu):
-        """Add actions to History menu"""
-        view_history_action = QAction("View History", self.browser)
-        clear_history_action = QAction("Clear History", self.browser)
-        
-        menu.addAction(view_history_action)
-        menu.addAction(clear_history_action)
-        
-        view_history_action.triggered.connect(self.browser.navigation_manager.view_history)
-        clear_history_action.triggered.connect(self.browser.navigation_manager.clear_history)
-
-    def add_additional_menus(self, menu_bar):
-        """Add additional menus (Statistics, Help, About)"""
-        # Statistics menu
-        stats_menu = menu_bar.addMenu("&Statistics")
-        view_stats_action = QAction("View Statistics", self.browser)
-        stats_menu.addAction(view_stats_action)
-        view_stats_action.triggered.connect(self.browser.view_statistics)
-        
-        # Help menu
-        help_menu = menu_bar.addMenu("Hel&p")
-        help_content_action = QAction("Help Contents", self.browser)
-        help_menu.addAction(help_content_action)
-        help_content_action.triggered.connect(self.browser.show_help)
-        
-        # About menu
-        about_menu = menu_bar.addMenu("&About")
-        about_action = QAction("About Spidy", self.browser)
-        release_history_action = QAction("Release History", self.browser)
-        about_menu.addAction(about_action)
-        about_menu.addAction(release_history_action)
-        about_action.triggered.connect(self.browser.show_about)
-        release_history_action.triggered.connect(self.browser.show_release_history)
-